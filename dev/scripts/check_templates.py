@@ -10,33 +10,31 @@ Usage:
     uv run python dev/scripts/check_templates.py awesome_cv   # Check specific template
     uv run python dev/scripts/check_templates.py moderncv     # Check specific template
 """
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 # Add src to path to import latex_escape filter
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
 from awesomecv_jinja.config import latex_escape
 
+# Compiled template bytecode is kept here between runs (gitignored)
+BYTECODE_CACHE_DIR = Path('.jinja-cache')
 
-def check_templates(template_name: str | None = None) -> bool:
-    """
-    Validate all templates for syntax errors.
-
-    Args:
-        template_name: Optional template directory name to check.
-                       If None, checks all templates.
 
-    Returns:
-        True if all templates pass validation, False otherwise.
+@cache
+def _get_environment(templates_base: Path) -> Environment:
     """
-    templates_base = Path('src/awesomecv_jinja/templates')
+    Create (once per templates directory) a Jinja2 environment with custom delimiters.
 
-    if not templates_base.exists():
-        print(f"✗ Templates directory not found: {templates_base}")
-        return False
+    Compiled templates are stored in BYTECODE_CACHE_DIR, so unchanged
+    templates skip the lex/parse/compile steps on repeated runs.
+    """
+    BYTECODE_CACHE_DIR.mkdir(exist_ok=True)
 
-    # Create Jinja2 environment with custom delimiters
     env = Environment(
         loader=FileSystemLoader(str(templates_base)),
         block_start_string='((*',
@@ -49,11 +47,63 @@ def check_templates(template_name: str | None = None) -> bool:
         lstrip_blocks=True,
         keep_trailing_newline=True,
         autoescape=False,
+        bytecode_cache=FileSystemBytecodeCache(str(BYTECODE_CACHE_DIR)),
     )
 
     # Register custom filters
     env.filters['latex_escape'] = latex_escape
 
+    return env
+
+
+def _iter_template_files(directory: str):
+    """
+    Recursively yield paths of all .tex.j2 files under directory.
+
+    Uses os.scandir, which reports entry types from the directory listing
+    instead of calling stat() for each entry.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_template_files(entry.path)
+            elif entry.name.endswith('.tex.j2') and entry.is_file():
+                yield entry.path
+
+
+def _load_template(env: Environment, name: str) -> Exception | None:
+    """
+    Load and compile a single template.
+
+    Returns:
+        None if the template compiles, the raised exception otherwise.
+    """
+    try:
+        env.get_template(name)
+    except Exception as e:
+        return e
+    return None
+
+
+def check_templates(template_name: str | None = None) -> bool:
+    """
+    Validate all templates for syntax errors.
+
+    Args:
+        template_name: Optional template directory name to check.
+                       If None, checks all templates.
+
+    Returns:
+        True if all templates pass validation, False otherwise.
+    """
+    templates_base = Path('src/awesomecv_jinja/templates')
+
+    if not templates_base.exists():
+        print(f"✗ Templates directory not found: {templates_base}")
+        return False
+
+    env = _get_environment(templates_base)
+
     # Determine which template directories to check
     if template_name:
         template_dirs = [templates_base / template_name]
@@ -62,7 +112,8 @@ def check_templates(template_name: str | None = None) -> bool:
             return False
     else:
         # Check all template directories
-        template_dirs = [d for d in templates_base.iterdir() if d.is_dir()]
+        with os.scandir(templates_base) as entries:
+            template_dirs = [Path(entry.path) for entry in entries if entry.is_dir()]
 
     if not template_dirs:
         print("✗ No template directories found")
@@ -71,28 +122,45 @@ def check_templates(template_name: str | None = None) -> bool:
     errors = []
     success_count = 0
 
-    for template_dir in sorted(template_dirs):
-        print(f"\n{'='*60}")
-        print(f"Checking: {template_dir.name}")
-        print('='*60)
-
-        # Check all .tex.j2 files in this template directory
-        template_files = list(template_dir.rglob('*.tex.j2'))
-
-        if not template_files:
-            print(f"  (no .tex.j2 files found)")
-            continue
-
-        for template_file in sorted(template_files):
-            rel_path = template_file.relative_to(templates_base)
-            try:
-                # Try to load and compile the template
-                env.get_template(str(rel_path))
-                print(f"  ✓ {rel_path}")
-                success_count += 1
-            except Exception as e:
-                errors.append((rel_path, str(e)))
-                print(f"  ✗ {rel_path}: {e}")
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        # Submit templates from all directories up front, so directories
+        # are checked concurrently; results are reported in sorted order
+        # Template names are relative to templates_base: slice the string
+        # prefix instead of calling Path.relative_to for every file
+        base_len = len(str(templates_base)) + 1
+        checks = []
+        for template_dir in sorted(template_dirs):
+            template_files = sorted(
+                _iter_template_files(str(template_dir)),
+                key=lambda path: path.split(os.sep),
+            )
+            rel_paths = [
+                template_file[base_len:].replace(os.sep, '/')
+                for template_file in template_files
+            ]
+            futures = [
+                executor.submit(_load_template, env, rel_path)
+                for rel_path in rel_paths
+            ]
+            checks.append((template_dir, rel_paths, futures))
+
+        for template_dir, rel_paths, futures in checks:
+            print(f"\n{'='*60}")
+            print(f"Checking: {template_dir.name}")
+            print('='*60)
+
+            if not rel_paths:
+                print(f"  (no .tex.j2 files found)")
+                continue
+
+            for rel_path, future in zip(rel_paths, futures):
+                error = future.result()
+                if error is None:
+                    print(f"  ✓ {rel_path}")
+                    success_count += 1
+                else:
+                    errors.append((rel_path, str(error)))
+                    print(f"  ✗ {rel_path}: {error}")
 
     # Summary
     print(f"\n{'='*60}")
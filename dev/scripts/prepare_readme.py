@@ -26,9 +26,30 @@ import sys
 import unicodedata
 from pathlib import Path
 
+try:
+    # Python 3.11+ has tomllib built-in
+    import tomllib
+except ImportError:
+    # Python 3.10 and below need tomli
+    import tomli as tomllib
+
 # Project root directory
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 
+# Precompiled patterns
+# Markdown heading (##, ###, etc.), one match per line, together with the
+# previous line if it is already an HTML anchor (<a id=...></a>)
+HEADING_RE = re.compile(
+    r'(?P<anchor>^[^\S\n]*<a id=[^\n]*></a>[^\S\n]*\n)?'
+    r'^(?P<indent>[^\S\n]*)#{2,6}[^\S\n]+(?P<title>.+)$',
+    re.MULTILINE,
+)
+# Markdown links: [text](path)
+# Absolute URLs and fragments are skipped in code (see ABSOLUTE_LINK_PREFIXES)
+LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+# Link targets that are left unchanged
+ABSOLUTE_LINK_PREFIXES = ('http://', 'https://', 'mailto:', '#')
+
 
 def get_github_base_url() -> str:
     """Extract GitHub repository URL from pyproject.toml.
@@ -37,19 +58,18 @@ def get_github_base_url() -> str:
         Base URL for raw file links (e.g., https://github.com/user/repo/blob/main)
     """
     pyproject_path = PROJECT_ROOT / "pyproject.toml"
-    content = pyproject_path.read_text(encoding="utf-8")
+    with pyproject_path.open("rb") as f:
+        pyproject_data = tomllib.load(f)
 
-    # Extract Repository URL from [project.urls]
-    match = re.search(r'Repository\s*=\s*"([^"]+)"', content)
-    if not match:
-        # Fallback to Homepage
-        match = re.search(r'Homepage\s*=\s*"([^"]+)"', content)
+    # Extract Repository URL from [project.urls], fallback to Homepage
+    urls = pyproject_data.get("project", {}).get("urls", {})
+    repo_url = urls.get("Repository") or urls.get("Homepage")
 
-    if not match:
+    if not repo_url:
         print("Error: Could not find Repository or Homepage URL in pyproject.toml")
         sys.exit(1)
 
-    repo_url = match.group(1).rstrip(".git")
+    repo_url = repo_url.rstrip(".git")
     return f"{repo_url}/blob/main"
 
 
@@ -70,21 +90,30 @@ def generate_anchor_id(text: str) -> str:
         Anchor ID string
     """
     # Normalize unicode (e.g., é -> e)
-    text = unicodedata.normalize("NFKD", text)
+    # ASCII text is already in NFKD form, so skip normalization entirely
+    if not text.isascii() and not unicodedata.is_normalized("NFKD", text):
+        text = unicodedata.normalize("NFKD", text)
     # Convert to lowercase
     text = text.lower()
-    # Replace spaces and underscores with hyphens
-    text = re.sub(r'[\s_]+', '-', text)
-    # Remove all non-alphanumeric characters except hyphens
-    text = re.sub(r'[^\w\-]', '', text)
-    # Remove consecutive hyphens
-    text = re.sub(r'-+', '-', text)
-    # Strip leading/trailing hyphens
-    text = text.strip('-')
-    return text
-
-
-def add_heading_anchors(content: str) -> str:
+
+    # Single pass: keep alphanumerics, turn runs of spaces, underscores and
+    # hyphens into one hyphen, drop everything else. Leading hyphens are
+    # never emitted; a trailing one is stripped below.
+    result = []
+    prev_hyphen = True
+    for char in text:
+        if char.isalnum():
+            result.append(char)
+            prev_hyphen = False
+        elif char in '-_' or char.isspace():
+            if not prev_hyphen:
+                result.append('-')
+                prev_hyphen = True
+
+    return ''.join(result).rstrip('-')
+
+
+def add_heading_anchors(content: str) -> tuple[str, int]:
     """Add HTML anchors before markdown headings for PyPI compatibility.
 
     PyPI's readme_renderer doesn't auto-generate IDs for headings, so we
@@ -94,44 +123,32 @@ def add_heading_anchors(content: str) -> str:
         content: Markdown content
 
     Returns:
-        Content with HTML anchors added before headings
+        Tuple of content with HTML anchors added before headings
+        and the number of anchors added
     """
-    lines = content.split('\n')
-    result = []
-    i = 0
-
-    while i < len(lines):
-        line = lines[i]
-
-        # Check if this is a heading (##, ###, etc.)
-        heading_match = re.match(r'^(\s*)(#{2,6})\s+(.+)$', line)
+    # Every heading contains "##" - skip the regex pass if there are none
+    if '##' not in content:
+        return content, 0
 
-        if heading_match:
-            indent = heading_match.group(1)
-            heading_text = heading_match.group(3)
+    anchor_count = 0
 
-            # Check if previous line is already an anchor
-            has_anchor = False
-            if i > 0:
-                prev_line = result[-1].strip()
-                if prev_line.startswith('<a id=') and prev_line.endswith('></a>'):
-                    has_anchor = True
+    def add_anchor(match: re.Match) -> str:
+        nonlocal anchor_count
 
-            # Add anchor if not already present
-            if not has_anchor:
-                anchor_id = generate_anchor_id(heading_text)
-                result.append(f"{indent}<a id=\"{anchor_id}\"></a>")
+        # Keep headings that already have an anchor
+        if match.group('anchor'):
+            return match.group(0)
 
-            result.append(line)
-        else:
-            result.append(line)
+        anchor_id = generate_anchor_id(match.group('title'))
+        anchor_count += 1
+        return f"{match.group('indent')}<a id=\"{anchor_id}\"></a>\n{match.group(0)}"
 
-        i += 1
+    return HEADING_RE.sub(add_anchor, content), anchor_count
 
-    return '\n'.join(result)
 
-
-def convert_relative_links(content: str, base_url: str) -> str:
+def convert_relative_links(
+    content: str, base_url: str
+) -> tuple[str, list[tuple[str, str]]]:
     """Convert relative markdown links to absolute GitHub URLs.
 
     Args:
@@ -139,22 +156,26 @@ def convert_relative_links(content: str, base_url: str) -> str:
         base_url: Base URL for absolute links
 
     Returns:
-        Content with converted links
+        Tuple of content with converted links and the list of
+        original (text, path) pairs that were converted
     """
-    # Pattern for markdown links: [text](relative/path)
-    # Excludes:
-    # - URLs starting with http://, https://, mailto:, #
-    # - Already absolute paths
-    pattern = r'\[([^\]]+)\]\((?!https?://|mailto:|#)([^)]+)\)'
+    # Every link contains "](" - skip the regex pass if there are none
+    if '](' not in content:
+        return content, []
+
+    converted_links = []
 
     def replace_link(match: re.Match) -> str:
         text = match.group(1)
         path = match.group(2)
+        if path.startswith(ABSOLUTE_LINK_PREFIXES):
+            return match.group(0)
+        converted_links.append((text, path))
         # Remove leading ./ if present
         path = path.lstrip("./")
         return f"[{text}]({base_url}/{path})"
 
-    return re.sub(pattern, replace_link, content)
+    return LINK_RE.sub(replace_link, content), converted_links
 
 
 def main() -> None:
@@ -174,23 +195,20 @@ def main() -> None:
 
     # Step 1: Add HTML anchors before headings (for PyPI TOC support)
     print("Adding HTML anchors to headings...")
-    content = add_heading_anchors(content)
-
-    # Count anchors added (they appear before headings)
-    anchor_count = len(re.findall(r'^<a id="[^"]+"></a>', content, re.MULTILINE))
+    content, anchor_count = add_heading_anchors(content)
     print(f"  Added anchors to {anchor_count} heading(s)")
 
     # Step 2: Convert relative links to absolute GitHub URLs
-    converted = convert_relative_links(content, base_url)
+    converted, original_links = convert_relative_links(content, base_url)
 
-    # Count converted links
-    original_links = re.findall(r'\[([^\]]+)\]\((?!https?://|mailto:|#)([^)]+)\)', content)
     if original_links:
         print(f"Converted {len(original_links)} relative link(s):")
         for text, path in original_links:
             print(f"  - [{text}]({path})")
 
-    output_path.write_text(converted, encoding="utf-8")
+    # Encode once and write bytes: skips the text-mode I/O layer, and the
+    # UTF-8 encoder copies ASCII-only content (the common case) directly
+    output_path.write_bytes(converted.encode("utf-8"))
     print(f"Written to {output_path}")
 
 
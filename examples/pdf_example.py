@@ -21,10 +21,13 @@ def main():
     output_dir = Path("output/pdf")
     output_dir.mkdir(parents=True, exist_ok=True)
     
+    # Load resume sample once: render_pdf() does not modify its input,
+    # so examples 1, 4 and 5 share it
+    data = load_sample("resume")
+    
     # Example 1: Simple PDF generation
     print("1. Generating Resume PDF...")
     try:
-        data = load_sample("resume")
         pdf = render_pdf(data, output=output_dir / "resume.pdf")
         print(f"   ✅ PDF created: {pdf}")
         print(f"   📊 Size: {pdf.stat().st_size // 1024} KB")
@@ -61,7 +64,6 @@ def main():
     # Example 4: Keep .tex file
     print("4. Generating with .tex file preserved...")
     try:
-        data = load_sample("resume")
         pdf = render_pdf(
             data,
             output=output_dir / "resume_with_tex.pdf",
@@ -77,7 +79,6 @@ def main():
     # Example 5: Specify compilation engine
     print("5. Using specific engine (Docker)...")
     try:
-        data = load_sample("resume")
         pdf = render_pdf(
             data,
             output=output_dir / "resume_docker.pdf",
@@ -92,7 +93,7 @@ def main():
     # Example 6: Customized data
     print("6. Generating PDF with customized data...")
     try:
-        data = load_sample("resume")
+        data = load_sample("resume")  # Fresh copy: this example modifies it
         data["first_name"] = "Jane"
         data["last_name"] = "Smith"
         data["position"] = "Senior Cloud Architect"
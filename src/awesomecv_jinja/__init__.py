@@ -23,10 +23,9 @@ Examples:
     >>> renderer.render("resume", data, output="resume.tex")
 """
 
-from .samples import load_sample, get_master_data
-from .renderer import Renderer, render
-from .compiler import PDFCompiler, CompilationEngine
-from .pipeline import render_pdf
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .exceptions import (
     AwesomeCVJinjaError,
     TemplateNotFoundError,
@@ -35,6 +34,40 @@ from .exceptions import (
     CompilationError,
 )
 
+if TYPE_CHECKING:
+    from .samples import load_sample, get_master_data
+    from .renderer import Renderer, render
+    from .compiler import PDFCompiler, CompilationEngine
+    from .pipeline import render_pdf, render_pdfs
+
+# Public names loaded on first access (PEP 562), so importing the package
+# (e.g., for __version__) does not pull in Jinja2 or subprocess machinery
+_LAZY_IMPORTS = {
+    "load_sample": ".samples",
+    "get_master_data": ".samples",
+    "Renderer": ".renderer",
+    "render": ".renderer",
+    "PDFCompiler": ".compiler",
+    "CompilationEngine": ".compiler",
+    "render_pdf": ".pipeline",
+    "render_pdfs": ".pipeline",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported names on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache: later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
 # Read version from package metadata (single source of truth: pyproject.toml)
 try:
     from importlib.metadata import version, PackageNotFoundError
@@ -46,33 +79,62 @@ try:
     __version__ = version("awesomecv-jinja")
 except PackageNotFoundError:
     # Fallback for development mode (package not installed)
-    # Read version directly from pyproject.toml
+    # Read version directly from pyproject.toml and cache it next to this
+    # file, so later imports skip TOML parsing until pyproject.toml changes
     from pathlib import Path
+    import os
+    import tempfile
     
     try:
-        # Python 3.11+ has tomllib built-in
-        try:
-            import tomllib
-        except ImportError:
-            # Python 3.10 and below need tomli
-            import tomli as tomllib
-        
         pyproject_path = Path(__file__).parent.parent.parent / "pyproject.toml"
-        if pyproject_path.exists():
+        version_cache = Path(__file__).parent / "_version.txt"
+        __version__ = ""
+        if not pyproject_path.exists():
+            __version__ = "0.0.0"
+        elif (
+            version_cache.exists()
+            and version_cache.stat().st_mtime >= pyproject_path.stat().st_mtime
+        ):
+            __version__ = version_cache.read_text(encoding="utf-8").strip()
+        
+        if not __version__:  # No usable cache
+            # Python 3.11+ has tomllib built-in
+            try:
+                import tomllib
+            except ImportError:
+                # Python 3.10 and below need tomli
+                import tomli as tomllib
+            
             with pyproject_path.open("rb") as f:
                 pyproject_data = tomllib.load(f)
                 __version__ = pyproject_data["project"]["version"]
-        else:
-            __version__ = "0.0.0"
+            
+            # Write a temporary file and rename it into place, so concurrent
+            # imports never read a partially written cache
+            try:
+                fd, temp_file = tempfile.mkstemp(
+                    dir=version_cache.parent, prefix="_version.", suffix=".tmp"
+                )
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        f.write(__version__)
+                    os.replace(temp_file, version_cache)
+                except OSError:
+                    os.unlink(temp_file)
+                    raise
+            except OSError:
+                pass  # Read-only location - parse again next time
     except Exception:
         # Ultimate fallback
         __version__ = "0.0.0"
+
 __all__ = [
     # Main API
     "Renderer",
     "render",
     # PDF Pipeline
     "render_pdf",
+    "render_pdfs",
     "PDFCompiler",
     "CompilationEngine",
     # Sample data
@@ -8,7 +8,7 @@ Simple command-line interface for generating professional CVs and resumes.
 import argparse
 import sys
 from pathlib import Path
-from typing import NoReturn
+from typing import List, NoReturn, Optional
 
 try:
     import yaml
@@ -19,15 +19,25 @@ except ImportError:
     )
     sys.exit(1)
 
-from .pipeline import render_pdf
-from .renderer import render
-from .compiler import PDFCompiler
+# Prefer the libyaml-based C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Rendering and compilation modules (and Jinja2) are imported only in the
+# branch that uses them, so --help and --version start quickly
 from .exceptions import AwesomeCVJinjaError
 from . import __version__
 
 
-def main() -> NoReturn:
-    """Main entry point for the acv CLI command."""
+# Option defaults, shared by the parser and the fast path
+DEFAULT_DOCTYPE = "resume"
+DEFAULT_ENGINE = "docker-sudo"
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the acv CLI command."""
     parser = argparse.ArgumentParser(
         prog="acv",
         description="Generate CV/Resume PDFs from YAML or compile existing .tex files",
@@ -56,7 +66,7 @@ def main() -> NoReturn:
         "-d",
         "--doctype",
         choices=["resume", "cv", "coverletter"],
-        default="resume",
+        default=DEFAULT_DOCTYPE,
         help="document type to generate (YAML input only, default: resume)",
     )
 
@@ -79,11 +89,20 @@ def main() -> NoReturn:
         help="generate only LaTeX (.tex) file without compiling to PDF",
     )
 
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=(
+            "reuse the previously compiled PDF if the generated LaTeX is unchanged "
+            "(YAML input only)"
+        ),
+    )
+
     parser.add_argument(
         "-e",
         "--engine",
-        choices=["auto", "xelatex", "docker", "docker-sudo"],
-        default="docker-sudo",
+        choices=["auto", "xelatex", "latexmk", "docker", "docker-sudo"],
+        default=DEFAULT_ENGINE,
         help="PDF compilation engine (default: docker-sudo)",
     )
 
@@ -94,8 +113,33 @@ def main() -> NoReturn:
         version=f"%(prog)s {__version__}",
     )
 
-    # Parse arguments
-    args = parser.parse_args()
+    return parser
+
+
+def _parse_fast_path(argv: List[str]) -> Optional[argparse.Namespace]:
+    """
+    Parse the common ``acv <file>`` invocation without building the parser.
+
+    Returns:
+        Namespace with default options, or None if argv has any other shape
+    """
+    if len(argv) != 1 or argv[0].startswith("-"):
+        return None
+    return argparse.Namespace(
+        input_file=Path(argv[0]),
+        doctype=DEFAULT_DOCTYPE,
+        output=None,
+        save_tex=False,
+        tex_only=False,
+        cache=False,
+        engine=DEFAULT_ENGINE,
+    )
+
+
+def main() -> NoReturn:
+    """Main entry point for the acv CLI command."""
+    # Parse arguments (a single positional file skips argparse setup)
+    args = _parse_fast_path(sys.argv[1:]) or _build_parser().parse_args()
 
     # Validate input file exists
     if not args.input_file.exists():
@@ -119,6 +163,8 @@ def main() -> NoReturn:
         print(f"🔨 Compiling LaTeX file: {args.input_file}")
         print(f"📦 Using engine: {args.engine}")
         
+        from .compiler import PDFCompiler
+        
         try:
             compiler = PDFCompiler(engine=args.engine)
             output_path = args.output or args.input_file.with_suffix(".pdf")
@@ -144,7 +190,7 @@ def main() -> NoReturn:
     # YAML mode: Load YAML data and render template
     try:
         with open(args.input_file, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=SafeLoader)
     except yaml.YAMLError as e:
         print(f"❌ Error: Invalid YAML file: {e}", file=sys.stderr)
         sys.exit(1)
@@ -170,6 +216,8 @@ def main() -> NoReturn:
         if args.tex_only:
             # Generate only .tex file
             print(f"🔨 Generating {args.doctype} LaTeX from {args.input_file}...")
+            from .renderer import render
+            
             render(
                 data,
                 doc_type=args.doctype,
@@ -180,12 +228,15 @@ def main() -> NoReturn:
             # Generate PDF (and optionally keep .tex)
             print(f"🔨 Generating {args.doctype} PDF from {args.input_file}...")
             print(f"📦 Using engine: {args.engine}")
+            from .pipeline import render_pdf
+            
             pdf_path = render_pdf(
                 data,
                 doc_type=args.doctype,
                 output=output_path,
                 engine=args.engine,
                 keep_tex=args.save_tex,
+                cache=args.cache,
             )
             print(f"✅ PDF created: {pdf_path}")
 
@@ -3,29 +3,82 @@ PDF compilation from LaTeX sources.
 
 Supports multiple compilation methods with automatic fallback:
 - Local xelatex (fastest)
+- Local latexmk with xelatex (reruns only when needed)
 - Docker with texlive/texlive:latest (no local LaTeX needed)
 - Docker with sudo (for systems requiring elevated privileges)
 """
 
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Union, Literal
+from typing import Dict, List, Optional, Tuple, Union, Literal
+import atexit
+import errno
 import subprocess
 import shutil
 import os
+import time
+import uuid
 
 from .exceptions import CompilationError
 
+# Seconds after a successful sudo credential check before checking again
+# (sudo caches credentials for 5 minutes by default)
+_SUDO_REFRESH_INTERVAL = 240
+
+# Maximum xelatex runs per compile; xelatex is rerun while the log
+# contains _RERUN_MARKER
+# ("Label(s) may have changed. Rerun to get cross-references right.")
+_MAX_XELATEX_RUNS = 3
+_RERUN_MARKER = b"Rerun to get"
+
+# Auxiliary files generated by LaTeX next to the .tex file
+_ARTIFACT_SUFFIXES = frozenset({
+    '.aux', '.log', '.out', '.toc', '.fls', '.fdb_latexmk', '.synctex.gz', '.xdv',
+})
+
 
 class CompilationEngine(Enum):
     """Available PDF compilation engines."""
     
     AUTO = "auto"                # Auto-detect best available
     XELATEX = "xelatex"         # Local xelatex
+    LATEXMK = "latexmk"         # Local latexmk driving xelatex
     DOCKER = "docker"            # Docker with texlive
     DOCKER_SUDO = "docker-sudo"  # Docker with sudo
 
 
+_ENGINES_BY_VALUE: Dict[str, CompilationEngine] = {
+    engine.value: engine for engine in CompilationEngine
+}
+
+
+@lru_cache(maxsize=8)
+def _which(name: str) -> Optional[str]:
+    """
+    Locate an executable on PATH.
+    
+    Cached for the process lifetime: shutil.which stats every PATH entry,
+    and render_pdf() creates a new PDFCompiler for every document.
+    """
+    return shutil.which(name)
+
+
+def _move_file(src: Path, dst: Path) -> None:
+    """
+    Move a file, replacing dst if it exists.
+    
+    Uses a single rename when src and dst are on the same filesystem
+    and falls back to copying for cross-device moves.
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(src), str(dst))
+
+
 class PDFCompiler:
     """
     Compiles LaTeX files to PDF.
@@ -46,12 +99,19 @@ class PDFCompiler:
         Keep intermediate files:
         
         >>> pdf = compiler.compile_file("resume.tex", keep_artifacts=True)
+        
+        Reuse one running Docker container for repeated compiles:
+        
+        >>> with PDFCompiler(engine="docker", docker_warm=True) as compiler:
+        ...     for _ in range(3):
+        ...         compiler.compile_file("resume.tex")
     """
     
     def __init__(
         self,
-        engine: Literal["auto", "xelatex", "docker", "docker-sudo"] = "auto",
+        engine: Literal["auto", "xelatex", "latexmk", "docker", "docker-sudo"] = "auto",
         timeout: int = 60,
+        docker_warm: bool = False,
     ):
         """
         Initialize PDF compiler.
@@ -59,9 +119,51 @@ class PDFCompiler:
         Args:
             engine: Compilation engine to use (default: auto-detect)
             timeout: Maximum compilation time in seconds (default: 60)
+            docker_warm: Keep one running Docker container per source
+                directory and compile with ``docker exec`` instead of
+                starting a new container each time (default: False).
+                Containers are removed by close() or at interpreter exit.
         """
-        self.engine = CompilationEngine(engine)
+        # Dict lookup for the common case; CompilationEngine() converts
+        # enum members and raises ValueError for unknown names
+        known = _ENGINES_BY_VALUE.get(engine) if isinstance(engine, str) else None
+        self.engine = known or CompilationEngine(engine)
         self.timeout = timeout
+        self.docker_warm = docker_warm
+        self._warm_containers: Dict[Path, Tuple[str, bool]] = {}
+        self._sudo_checked_at: Optional[float] = None
+        
+        # Run containers as the current user, so compiled files aren't
+        # owned by root (os.getuid() doesn't exist on Windows)
+        if hasattr(os, "getuid"):
+            self._docker_user_args = ["--user", f"{os.getuid()}:{os.getgid()}"]
+        else:
+            self._docker_user_args = []
+    
+    def __enter__(self) -> "PDFCompiler":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Remove Docker containers started with docker_warm=True."""
+        if self._warm_containers:
+            # Registered when the first container was started
+            atexit.unregister(self.close)
+        while self._warm_containers:
+            _, (name, use_sudo) = self._warm_containers.popitem()
+            cmd = ["docker", "rm", "-f", name]
+            try:
+                subprocess.run(
+                    ["sudo"] + cmd if use_sudo else cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=self.timeout,
+                    check=False,
+                )
+            except (OSError, subprocess.TimeoutExpired):
+                pass  # Ignore cleanup errors
     
     def is_available(self, engine: CompilationEngine) -> bool:
         """
@@ -74,9 +176,11 @@ class PDFCompiler:
             True if engine is available, False otherwise
         """
         if engine == CompilationEngine.XELATEX:
-            return shutil.which("xelatex") is not None
+            return _which("xelatex") is not None
+        elif engine == CompilationEngine.LATEXMK:
+            return _which("latexmk") is not None and _which("xelatex") is not None
         elif engine in [CompilationEngine.DOCKER, CompilationEngine.DOCKER_SUDO]:
-            return shutil.which("docker") is not None
+            return _which("docker") is not None
         return False
     
     def detect_engine(self) -> CompilationEngine:
@@ -147,6 +251,8 @@ class PDFCompiler:
         # Compile with selected engine
         if engine == CompilationEngine.XELATEX:
             pdf_path = self._compile_with_xelatex(tex_path)
+        elif engine == CompilationEngine.LATEXMK:
+            pdf_path = self._compile_with_latexmk(tex_path)
         elif engine == CompilationEngine.DOCKER:
             pdf_path = self._compile_with_docker(tex_path, use_sudo=False)
         elif engine == CompilationEngine.DOCKER_SUDO:
@@ -159,7 +265,7 @@ class PDFCompiler:
             output_path = Path(output)
             output_path.parent.mkdir(parents=True, exist_ok=True)
             if pdf_path != output_path:
-                shutil.move(str(pdf_path), str(output_path))
+                _move_file(pdf_path, output_path)
                 pdf_path = output_path
         
         # Clean up artifacts
@@ -169,13 +275,58 @@ class PDFCompiler:
         return pdf_path
     
     def _compile_with_xelatex(self, tex_file: Path) -> Path:
-        """Compile using local xelatex."""
-        result = subprocess.run(
-            ["xelatex", "-interaction=nonstopmode", tex_file.name],
+        """
+        Compile using local xelatex.
+        
+        Reruns xelatex (up to _MAX_XELATEX_RUNS times in total) while the
+        log asks for it, so cross-references are resolved in one call.
+        """
+        log_file = tex_file.with_suffix(".log")
+        
+        for _ in range(_MAX_XELATEX_RUNS):
+            # Output is discarded: on failure, errors are read from the .log file
+            subprocess.run(
+                ["xelatex", "-interaction=nonstopmode", "-no-shell-escape", tex_file.name],
+                cwd=tex_file.parent,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=self.timeout,
+            )
+            if not self._needs_rerun(log_file):
+                break
+        
+        pdf_file = tex_file.with_suffix(".pdf")
+        
+        # Check if PDF was generated - this is the real success criteria
+        if not pdf_file.exists():
+            error = self._extract_latex_error(tex_file.with_suffix(".log"))
+            raise CompilationError(
+                f"xelatex compilation failed:\n{error}\n\n"
+                f"See {tex_file.with_suffix('.log')} for details"
+            )
+        
+        return pdf_file
+    
+    def _compile_with_latexmk(self, tex_file: Path) -> Path:
+        """
+        Compile using local latexmk with xelatex.
+        
+        latexmk reruns xelatex only until references are stable, and
+        skips compilation when the PDF is up to date with its inputs
+        (requires keep_artifacts to preserve its .fdb_latexmk database).
+        """
+        # Output is discarded: on failure, errors are read from the .log file
+        subprocess.run(
+            [
+                "latexmk", "-xelatex", "-interaction=nonstopmode", "-no-shell-escape",
+                tex_file.name,
+            ],
             cwd=tex_file.parent,
-            capture_output=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=self.timeout,
-            text=True
         )
         
         pdf_file = tex_file.with_suffix(".pdf")
@@ -184,7 +335,7 @@ class PDFCompiler:
         if not pdf_file.exists():
             error = self._extract_latex_error(tex_file.with_suffix(".log"))
             raise CompilationError(
-                f"xelatex compilation failed:\n{error}\n\n"
+                f"latexmk compilation failed:\n{error}\n\n"
                 f"See {tex_file.with_suffix('.log')} for details"
             )
         
@@ -192,35 +343,34 @@ class PDFCompiler:
     
     def _compile_with_docker(self, tex_file: Path, use_sudo: bool = False) -> Path:
         """Compile using Docker with texlive image."""
-        uid = os.getuid()
-        gid = os.getgid()
+        if use_sudo:
+            # Before the first sudo call, which may be starting a warm container
+            self._refresh_sudo()
         
-        cmd = [
-            "docker", "run",
-            "--rm",
-            "--user", f"{uid}:{gid}",
-            "-i",
-            "-w", "/doc",
-            "-v", f"{tex_file.parent.absolute()}:/doc",
-            "texlive/texlive:latest",
-            "xelatex", "-interaction=nonstopmode", tex_file.name
-        ]
+        if self.docker_warm:
+            container = self._get_warm_container(tex_file.parent, use_sudo)
+            cmd = [
+                "docker", "exec",
+                "-i",
+                "-w", "/doc",
+                container,
+                "xelatex", "-interaction=nonstopmode", "-no-shell-escape", tex_file.name
+            ]
+        else:
+            cmd = [
+                "docker", "run",
+                "--rm",
+                *self._docker_user_args,
+                "-i",
+                "-w", "/doc",
+                "-v", f"{tex_file.parent.absolute()}:/doc",
+                "texlive/texlive:latest",
+                "xelatex", "-interaction=nonstopmode", "-no-shell-escape", tex_file.name
+            ]
         
         if use_sudo:
             # Use sudo to run docker as root
             # Root has access to docker socket
-            # Try to refresh sudo cache first
-            try:
-                subprocess.run(
-                    ["sudo", "-v"],
-                    check=False,
-                    timeout=5,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL
-                )
-            except:
-                pass  # Ignore if sudo -v fails
-            
             cmd = ["sudo"] + cmd
         
         try:
@@ -238,14 +388,14 @@ class PDFCompiler:
                 result = subprocess.CompletedProcess(
                     args=cmd,
                     returncode=result.returncode if hasattr(result, 'returncode') else 0,
-                    stdout="",
                     stderr=""
                 )
             else:
-                # For non-sudo: capture output normally
+                # For non-sudo: discard the LaTeX transcript (it is also
+                # written to the .log file), keep Docker errors from stderr
                 result = subprocess.run(
                     cmd,
-                    stdout=subprocess.PIPE,
+                    stdout=subprocess.DEVNULL,
                     stderr=subprocess.PIPE,
                     stdin=subprocess.DEVNULL,
                     cwd=tex_file.parent,
@@ -262,7 +412,7 @@ class PDFCompiler:
         # Check if PDF was generated - this is the real success criteria
         # LaTeX may return non-zero even if PDF was created (warnings, overfull boxes, etc.)
         if not pdf_file.exists():
-            error_msg = result.stderr or result.stdout
+            error_msg = result.stderr or self._extract_latex_error(tex_file.with_suffix(".log"))
             raise CompilationError(
                 f"Docker compilation failed - no PDF generated:\n{error_msg}\n\n"
                 f"Command: {' '.join(cmd)}"
@@ -270,6 +420,103 @@ class PDFCompiler:
         
         return pdf_file
     
+    def _refresh_sudo(self) -> None:
+        """
+        Make sure sudo credentials are cached before running docker.
+        
+        Checks the credential cache non-interactively first and only runs
+        ``sudo -v`` (which may prompt for a password) when it is stale.
+        A successful check is trusted for _SUDO_REFRESH_INTERVAL seconds.
+        """
+        now = time.monotonic()
+        if (
+            self._sudo_checked_at is not None
+            and now - self._sudo_checked_at < _SUDO_REFRESH_INTERVAL
+        ):
+            return
+        
+        try:
+            result = subprocess.run(
+                ["sudo", "-nv"],
+                check=False,
+                timeout=2,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+            if result.returncode != 0:
+                result = subprocess.run(
+                    ["sudo", "-v"],
+                    check=False,
+                    timeout=5,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
+        except (OSError, subprocess.TimeoutExpired):
+            return  # Ignore if sudo -v fails
+        
+        if result.returncode == 0:
+            self._sudo_checked_at = now
+    
+    def _get_warm_container(self, work_dir: Path, use_sudo: bool) -> str:
+        """
+        Get a running container with work_dir mounted at /doc.
+        
+        Starts the container on first use for the directory.
+        
+        Raises:
+            CompilationError: If the container cannot be started
+        """
+        work_dir = work_dir.absolute()
+        if work_dir in self._warm_containers:
+            return self._warm_containers[work_dir][0]
+        
+        name = f"awesomecv-{uuid.uuid4().hex[:12]}"
+        cmd: List[str] = [
+            "docker", "run",
+            "-d",
+            "--rm",
+            "--name", name,
+            *self._docker_user_args,
+            "-w", "/doc",
+            "-v", f"{work_dir}:/doc",
+            "texlive/texlive:latest",
+            "sleep", "infinity"
+        ]
+        if use_sudo:
+            cmd = ["sudo"] + cmd
+        
+        try:
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                timeout=self.timeout,
+                text=True
+            )
+        except subprocess.TimeoutExpired as e:
+            raise CompilationError(
+                f"Docker container start timed out after {self.timeout}s"
+            ) from e
+        
+        if result.returncode != 0:
+            raise CompilationError(
+                f"Failed to start Docker container:\n{result.stderr}\n\n"
+                f"Command: {' '.join(cmd)}"
+            )
+        
+        if not self._warm_containers:
+            # Once per batch of containers: close() unregisters it
+            atexit.register(self.close)
+        self._warm_containers[work_dir] = (name, use_sudo)
+        return name
+    
+    def _needs_rerun(self, log_file: Path) -> bool:
+        """Check whether LaTeX asked for another run to fix references."""
+        try:
+            return _RERUN_MARKER in log_file.read_bytes()
+        except OSError:
+            return False
+    
     def _extract_latex_error(self, log_file: Path) -> str:
         """Extract readable error message from LaTeX log."""
         if not log_file.exists():
@@ -287,13 +534,22 @@ class PDFCompiler:
     
     def _cleanup_artifacts(self, tex_file: Path):
         """Remove auxiliary files generated by LaTeX."""
-        artifacts = ['.aux', '.log', '.out', '.toc', '.fls', '.fdb_latexmk', '.synctex.gz']
-        
-        for ext in artifacts:
-            artifact = tex_file.with_suffix(ext)
-            if artifact.exists():
-                try:
-                    artifact.unlink()
-                except Exception:
-                    pass  # Ignore cleanup errors
+        stem = tex_file.stem
+        
+        # One directory listing instead of a stat() per artifact type
+        try:
+            with os.scandir(tex_file.parent) as entries:
+                artifacts = [
+                    entry.path for entry in entries
+                    if entry.name.startswith(stem)
+                    and entry.name[len(stem):] in _ARTIFACT_SUFFIXES
+                ]
+        except OSError:
+            return  # Ignore cleanup errors
+        
+        for artifact in artifacts:
+            try:
+                os.unlink(artifact)
+            except OSError:
+                pass  # Ignore cleanup errors
 
@@ -5,14 +5,34 @@ Provides custom Jinja2 environment with LaTeX-compatible delimiters
 and LaTeX-specific filters.
 """
 
-from jinja2 import Environment, PackageLoader, FileSystemLoader
+from jinja2 import BytecodeCache, Environment, PackageLoader, FileSystemLoader
 from pathlib import Path
 from typing import Optional
+import re
+
+
+# LaTeX special characters and their escaped forms
+_LATEX_ESCAPES = {
+    '\\': r'\textbackslash{}',
+    '&': r'\&',
+    '%': r'\%',
+    '$': r'\$',
+    '#': r'\#',
+    '_': r'\_',
+    '{': r'\{',
+    '}': r'\}',
+    '~': r'\textasciitilde{}',
+    '^': r'\^{}',
+}
+_LATEX_SPECIAL_CHARS = frozenset(_LATEX_ESCAPES)
+_LATEX_SPECIAL_RE = re.compile('[' + re.escape(''.join(_LATEX_ESCAPES)) + ']')
 
 
 def create_latex_environment(
     template_loader: Optional[str] = None,
     custom_template_dir: Optional[Path] = None,
+    bytecode_cache: Optional[BytecodeCache] = None,
+    auto_reload: bool = True,
 ) -> Environment:
     """
     Create Jinja2 environment configured for LaTeX templates.
@@ -25,6 +45,11 @@ def create_latex_environment(
     Args:
         template_loader: Name of template package to load (e.g., "awesome_cv")
         custom_template_dir: Path to custom templates directory (overrides package)
+        bytecode_cache: Optional Jinja2 bytecode cache for compiled templates
+            (e.g., FileSystemBytecodeCache to reuse them across processes)
+        auto_reload: Check on every template lookup whether the source
+            file changed (default: True). Disable for templates that
+            never change while the process runs, such as installed ones.
     
     Returns:
         Configured Jinja2 Environment instance
@@ -69,6 +94,8 @@ def create_latex_environment(
         keep_trailing_newline=True,  # Keep final newline
         # Security
         autoescape=False,       # LaTeX is not HTML - don't autoescape
+        bytecode_cache=bytecode_cache,
+        auto_reload=auto_reload,
     )
     
     # Register custom filters
@@ -101,34 +128,24 @@ def latex_escape(text: str) -> str:
         'C:\\textbackslash{}Users\\textbackslash{}file.txt'
     
     Note:
-        Backslash must be replaced first to avoid double-escaping.
+        All characters are replaced in a single pass, so the braces
+        added for backslash are not escaped again.
     """
     if not isinstance(text, str):
         text = str(text)
     
-    # Use placeholder for backslash to avoid double-escaping
-    # This prevents {} in \textbackslash{} from being escaped
-    BACKSLASH_PLACEHOLDER = '\x00BACKSLASH\x00'
-    text = text.replace('\\', BACKSLASH_PLACEHOLDER)
-    
-    # Now handle other special characters
-    replacements = {
-        '&': r'\&',
-        '%': r'\%',
-        '$': r'\$',
-        '#': r'\#',
-        '_': r'\_',
-        '{': r'\{',
-        '}': r'\}',
-        '~': r'\textasciitilde{}',
-        '^': r'\^{}',
-    }
+    # Most values contain no special characters: return them as is
+    # instead of building an identical copy
+    if _LATEX_SPECIAL_CHARS.isdisjoint(text):
+        return text
     
-    for char, escaped in replacements.items():
-        text = text.replace(char, escaped)
-    
-    # Replace placeholder with final LaTeX command
-    text = text.replace(BACKSLASH_PLACEHOLDER, r'\textbackslash{}')
-    
-    return text
+    # One regex pass replaces each match exactly once, so the braces in
+    # \textbackslash{} are never escaped again. It is faster than
+    # str.translate with a string-valued table, which maps every
+    # character of the text through a dict lookup.
+    return _LATEX_SPECIAL_RE.sub(_escape_match, text)
+
 
+def _escape_match(match: re.Match) -> str:
+    """Return the escaped form of a matched LaTeX special character."""
+    return _LATEX_ESCAPES[match.group()]
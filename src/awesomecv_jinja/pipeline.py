@@ -4,13 +4,15 @@ Pipeline API for data → PDF conversion.
 Combines rendering and compilation in a single convenient interface.
 """
 
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
 from pathlib import Path
-from typing import Dict, Any, Union, Literal
+from typing import Dict, Any, List, Optional, Union, Literal
+import hashlib
 import tempfile
 import shutil
-
-from .renderer import Renderer
-from .compiler import PDFCompiler
+import os
 
 
 def render_pdf(
@@ -18,8 +20,9 @@ def render_pdf(
     doc_type: str = "resume",
     template: str = "awesome_cv",
     output: Union[str, Path] = "output.pdf",
-    engine: Literal["auto", "xelatex", "docker", "docker-sudo"] = "auto",
+    engine: Literal["auto", "xelatex", "latexmk", "docker", "docker-sudo"] = "auto",
     keep_tex: bool = False,
+    cache: bool = False,
 ) -> Path:
     """
     Render data directly to PDF (data → PDF in one call).
@@ -35,8 +38,12 @@ def render_pdf(
         doc_type: Document type (resume, cv, coverletter)
         template: Template to use (default: awesome_cv)
         output: Output PDF path
-        engine: Compilation engine (auto/xelatex/docker/docker-sudo)
+        engine: Compilation engine (auto/xelatex/latexmk/docker/docker-sudo)
         keep_tex: Keep intermediate .tex file (default: False)
+        cache: Reuse a previously compiled PDF if the rendered LaTeX,
+            template assets, photo file, build directory and engine are
+            unchanged, and store newly compiled PDFs for reuse
+            (default: False). See _pdf_cache_dir().
     
     Returns:
         Path to generated PDF file
@@ -66,7 +73,17 @@ def render_pdf(
         
         >>> cv_data = load_sample("cv")
         >>> pdf = render_pdf(cv_data, doc_type="cv", output="cv.pdf")
+        
+        Skip compilation when nothing changed since the last build:
+        
+        >>> pdf = render_pdf(data, output="resume.pdf", cache=True)
     """
+    # Imported here: loading the pipeline module (e.g. by the CLI)
+    # doesn't need Jinja2 until a document is rendered
+    from .renderer import _get_renderer
+    from .compiler import PDFCompiler, _move_file
+    from .exceptions import CompilationError
+    
     output_path = Path(output).absolute()
     pdf_path = None  # Initialize for finally block
     
@@ -78,34 +95,58 @@ def render_pdf(
         work_dir.mkdir(parents=True, exist_ok=True)
         cleanup_dir = None
     else:
-        # Create in temporary directory
-        temp_dir = tempfile.mkdtemp(prefix="awesomecv_")
+        # Create in temporary directory (RAM-backed if available)
+        temp_dir = tempfile.mkdtemp(prefix="awesomecv_", dir=_scratch_dir_base())
         work_dir = Path(temp_dir)
         tex_file = work_dir / "document.tex"
         cleanup_dir = work_dir
     
     try:
         # Step 1: Render tex
-        renderer = Renderer(template=template)
-        renderer.render(doc_type, data, output=tex_file)
+        _get_renderer(template).render_to_file(doc_type, data, tex_file)
         
         # Step 2: Copy required .cls and other assets
         _copy_template_assets(template, work_dir)
         
-        # Step 3: Compile to PDF
+        # Step 3: Compile to PDF (or reuse a cached PDF of identical input)
+        cached_pdf = None
+        if cache:
+            cached_pdf = _cached_pdf_path(
+                tex_file,
+                template,
+                engine,
+                photo=data.get("photo"),
+                # Relative paths in the .tex resolve against the build directory
+                build_dir=work_dir if keep_tex else None,
+            )
+        if cached_pdf is not None and cached_pdf.is_file():
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(cached_pdf, output_path)
+            pdf_path = output_path
+            return pdf_path
+        
         compiler = PDFCompiler(engine=engine)
-        pdf_path = compiler.compile_file(
-            tex_file,
-            output=None,  # Compile in place first
-            keep_artifacts=keep_tex
-        )
+        try:
+            pdf_path = compiler.compile_file(
+                tex_file,
+                output=None,  # Compile in place first
+                keep_artifacts=keep_tex
+            )
+        except CompilationError as e:
+            if cleanup_dir is None:
+                raise
+            # The temporary directory is kept for debugging (see below)
+            raise CompilationError(f"{e}\n\nBuild files kept in: {cleanup_dir}") from e
         
         # Step 4: Move PDF to final location
         if pdf_path != output_path:
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.move(str(pdf_path), str(output_path))
+            _move_file(pdf_path, output_path)
             pdf_path = output_path
         
+        if cached_pdf is not None:
+            _store_cached_pdf(pdf_path, cached_pdf)
+        
         return pdf_path
     
     finally:
@@ -118,6 +159,112 @@ def render_pdf(
                 pass  # Ignore cleanup errors
 
 
+def render_pdfs(
+    jobs: List[Dict[str, Any]],
+    max_workers: Optional[int] = None,
+) -> List[Path]:
+    """
+    Render several documents to PDF in parallel.
+    
+    Each job is a dictionary of keyword arguments for render_pdf().
+    Jobs run in separate processes, so independent LaTeX compilations
+    run concurrently. Job data may be read-only sample data from
+    load_sample(..., mutable=False).
+    
+    Args:
+        jobs: List of render_pdf() keyword argument dictionaries
+        max_workers: Maximum number of worker processes
+            (default: number of CPUs)
+    
+    Returns:
+        Paths to generated PDF files, in the same order as jobs
+    
+    Raises:
+        CompilationError: If PDF compilation fails for any job
+        RenderError: If template rendering fails for any job
+    
+    Examples:
+        >>> from awesomecv_jinja import render_pdfs, load_sample
+        >>> pdfs = render_pdfs([
+        ...     {"data": load_sample("resume"), "output": "resume.pdf"},
+        ...     {"data": load_sample("cv"), "doc_type": "cv", "output": "cv.pdf"},
+        ... ])
+    
+    Note:
+        Give each job a distinct output path. Jobs with the same output
+        path overwrite each other.
+    """
+    if not jobs:
+        return []
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = []
+        for job in jobs:
+            if "data" in job:
+                # Jobs are pickled to the worker processes, and read-only
+                # data from load_sample(..., mutable=False) can't be
+                job = {**job, "data": _plain_data(job["data"])}
+            futures.append(executor.submit(render_pdf, **job))
+        return [future.result() for future in futures]
+
+
+def _plain_data(obj: Any) -> Any:
+    """
+    Copy document data with read-only mappings turned into dicts.
+    
+    Mapping views such as types.MappingProxyType can't be pickled.
+    
+    Args:
+        obj: Document data (or a value in it)
+    
+    Returns:
+        The data with every mapping a dict; other values are unchanged
+    """
+    if isinstance(obj, Mapping):
+        return {key: _plain_data(value) for key, value in obj.items()}
+    if type(obj) in (list, tuple):
+        return type(obj)(_plain_data(value) for value in obj)
+    return obj
+
+
+# RAM-backed filesystem (tmpfs) on most Linux systems
+_SHM_DIR = "/dev/shm"
+
+# Directories tempfile.gettempdir() falls back to when none is configured
+_DEFAULT_TEMP_DIRS = ("/tmp", "/var/tmp", "/usr/tmp")
+
+
+def _scratch_dir_base() -> Optional[str]:
+    """
+    Get the parent directory for temporary compilation directories.
+    
+    LaTeX writes several small auxiliary files per run. A tmpfs directory
+    avoids disk metadata and writeback traffic for them. A temporary
+    directory configured by the user (TMPDIR, TEMP, TMP or
+    tempfile.tempdir) always takes precedence.
+    
+    Returns:
+        /dev/shm if no temporary directory is configured and /dev/shm
+        exists and is writable, otherwise None (the default temporary
+        directory)
+    """
+    if any(os.environ.get(name) for name in ("TMPDIR", "TEMP", "TMP")):
+        return None
+    # gettempdir() stores the directory it picks in tempfile.tempdir,
+    # so only a non-default value there was set by the user
+    if tempfile.tempdir is not None and tempfile.tempdir not in _DEFAULT_TEMP_DIRS:
+        return None
+    if os.path.isdir(_SHM_DIR) and os.access(_SHM_DIR, os.W_OK):
+        return _SHM_DIR
+    return None
+
+
+# Files that must be next to the .tex file to compile each template
+_TEMPLATE_ASSETS: Dict[str, List[str]] = {
+    "awesome_cv": ["awesome-cv.cls"],
+}
+
+
 def _copy_template_assets(template: str, target_dir: Path):
     """
     Copy required template assets (.cls files, fonts, etc.) to target directory.
@@ -127,31 +274,162 @@ def _copy_template_assets(template: str, target_dir: Path):
         target_dir: Directory to copy assets to
     """
     try:
-        # For awesome_cv, we need awesome-cv.cls
-        if template == "awesome_cv":
-            # Try to find .cls in package
-            try:
-                from importlib.resources import files
-                template_files = files("awesomecv_jinja").joinpath(f"templates/{template}")
-                cls_content = template_files.joinpath("awesome-cv.cls").read_text()
-                (target_dir / "awesome-cv.cls").write_text(cls_content)
-            except Exception:
-                # Fallback: try file system path
-                from pathlib import Path
-                import awesomecv_jinja
-                package_dir = Path(awesomecv_jinja.__file__).parent
-                cls_file = package_dir / f"templates/{template}/awesome-cv.cls"
-                
-                if cls_file.exists():
-                    shutil.copy2(cls_file, target_dir / "awesome-cv.cls")
-                else:
-                    # Last resort: might be in development mode
-                    cls_dev = Path("src/awesomecv_jinja") / f"templates/{template}/awesome-cv.cls"
-                    if cls_dev.exists():
-                        shutil.copy2(cls_dev, target_dir / "awesome-cv.cls")
+        for name in _TEMPLATE_ASSETS.get(template, []):
+            (target_dir / name).write_bytes(_read_template_asset(template, name))
     
     except Exception:
         # Don't fail if we can't copy assets - LaTeX might still work
         # if cls file is already in the directory
         pass
 
+
+@cache
+def _read_template_asset(template: str, name: str) -> bytes:
+    """
+    Read a template asset file (cached for the process lifetime).
+    
+    Edits to an asset (e.g., awesome-cv.cls in a development checkout)
+    are not seen by a running process: it keeps copying the bytes read
+    first, and render_pdf(cache=True) keys cached PDFs on them. Restart
+    the process to pick up the change.
+    
+    Args:
+        template: Template name (e.g., "awesome_cv")
+        name: Asset file name (e.g., "awesome-cv.cls")
+    
+    Returns:
+        Raw file content
+    
+    Raises:
+        FileNotFoundError: If the asset cannot be found
+    """
+    # Try to find asset in package
+    try:
+        from importlib.resources import files
+        template_files = files("awesomecv_jinja").joinpath(f"templates/{template}")
+        return template_files.joinpath(name).read_bytes()
+    except Exception:
+        pass
+    
+    # Fallback: try file system path
+    import awesomecv_jinja
+    package_dir = Path(awesomecv_jinja.__file__).parent
+    candidates = [
+        package_dir / f"templates/{template}/{name}",
+        # Last resort: might be in development mode
+        Path("src/awesomecv_jinja") / f"templates/{template}/{name}",
+    ]
+    for asset_file in candidates:
+        if asset_file.exists():
+            return asset_file.read_bytes()
+    
+    raise FileNotFoundError(f"Template asset not found: {template}/{name}")
+
+
+def _pdf_cache_dir() -> Path:
+    """
+    Get the directory for PDFs cached by render_pdf(cache=True).
+    
+    Returns:
+        $XDG_CACHE_HOME/awesomecv_jinja/pdf, or ~/.cache/awesomecv_jinja/pdf
+        if XDG_CACHE_HOME is not set
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "awesomecv_jinja" / "pdf"
+
+
+def _cached_pdf_path(
+    tex_file: Path,
+    template: str,
+    engine: str,
+    photo: Optional[str] = None,
+    build_dir: Optional[Path] = None,
+) -> Path:
+    """
+    Get the cache location of the PDF compiled from tex_file.
+    
+    The file name is a hash of everything that determines the PDF:
+    the rendered LaTeX, the template assets, the photo file, the
+    build directory and the engine.
+    
+    Args:
+        tex_file: Rendered .tex file
+        template: Template name (e.g., "awesome_cv")
+        engine: Compilation engine name
+        photo: The document's photo value, if any
+        build_dir: Directory the .tex is compiled in, or None for a
+            fresh temporary directory
+    
+    Returns:
+        Path of the cached PDF (which may not exist yet)
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{template}\0{engine}\0{build_dir or ''}\0".encode())
+    digest.update(tex_file.read_bytes())
+    for name in _TEMPLATE_ASSETS.get(template, []):
+        try:
+            digest.update(_read_template_asset(template, name))
+        except FileNotFoundError:
+            pass
+    
+    if photo:
+        for photo_file in _photo_files(photo, tex_file.parent):
+            digest.update(f"{photo_file}\0".encode())
+            try:
+                digest.update(photo_file.read_bytes())
+            except OSError:
+                pass
+    
+    key = digest.hexdigest()
+    return _pdf_cache_dir() / key[:2] / f"{key}.pdf"
+
+
+# Extensions LaTeX tries for a graphics file given without one
+_GRAPHICS_EXTENSIONS = ("", ".pdf", ".png", ".jpg", ".jpeg", ".eps")
+
+
+def _photo_files(photo: str, base_dir: Path) -> List[Path]:
+    """
+    Find the image files a photo value may refer to.
+    
+    Args:
+        photo: Photo path, optionally with \\photo options
+            (e.g., "[circle,noedge,left]{./examples/profile}")
+        base_dir: Directory relative paths are resolved against
+    
+    Returns:
+        Existing files the path can resolve to, with or without
+        a graphics file extension
+    """
+    path = photo.rsplit("{", 1)[-1].rstrip("}").strip()
+    if not path:
+        return []
+    
+    photo_path = base_dir / path
+    candidates = (photo_path.with_name(photo_path.name + ext) for ext in _GRAPHICS_EXTENSIONS)
+    return [candidate.resolve() for candidate in candidates if candidate.is_file()]
+
+
+def _store_cached_pdf(pdf_path: Path, cached_pdf: Path):
+    """
+    Copy a compiled PDF into the cache.
+    
+    The copy is written to a temporary file first and renamed into place,
+    so concurrent builds never see a partially written PDF.
+    
+    Args:
+        pdf_path: Compiled PDF
+        cached_pdf: Cache location from _cached_pdf_path()
+    """
+    try:
+        cached_pdf.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_file = tempfile.mkstemp(dir=cached_pdf.parent, suffix=".tmp")
+        os.close(fd)
+        try:
+            shutil.copyfile(pdf_path, temp_file)
+            os.replace(temp_file, cached_pdf)
+        except OSError:
+            os.unlink(temp_file)
+            raise
+    except OSError:
+        pass  # Caching is best effort
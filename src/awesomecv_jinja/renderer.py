@@ -4,9 +4,11 @@ Renderer for LaTeX CV templates.
 Provides main rendering functionality for converting data to LaTeX documents.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional, Union, List
-from jinja2 import TemplateNotFound
+from jinja2 import Environment, FileSystemBytecodeCache, Template, TemplateNotFound
+from jinja2.bccache import Bucket
 
 from .config import create_latex_environment
 from .exceptions import (
@@ -16,6 +18,68 @@ from .exceptions import (
 )
 
 
+@lru_cache(maxsize=16)
+def _get_environment(
+    template: Optional[str],
+    custom_template_dir: Optional[Path],
+) -> Environment:
+    """
+    Get a shared Jinja2 environment for a template package or directory.
+    
+    Environments are cached, so every Renderer for the same templates
+    reuses already loaded and compiled templates. Compiled template
+    bytecode is also stored in the per-user temporary directory and
+    reused by later processes, when that directory is usable.
+    
+    Built-in templates are installed with the package and don't change,
+    so their loaded templates are reused without checking the source
+    files again. Custom template directories are still checked, so
+    edits are picked up.
+    """
+    return create_latex_environment(
+        template_loader=template,
+        custom_template_dir=custom_template_dir,
+        bytecode_cache=_create_bytecode_cache(),
+        auto_reload=custom_template_dir is not None,
+    )
+
+
+class _BestEffortBytecodeCache(FileSystemBytecodeCache):
+    """
+    Bytecode cache that never makes rendering fail.
+    
+    The cache only saves compiling templates again in later processes,
+    so files that can't be read or written are ignored and the template
+    is compiled in memory instead.
+    """
+    
+    def load_bytecode(self, bucket: Bucket) -> None:
+        try:
+            super().load_bytecode(bucket)
+        except OSError:
+            pass
+    
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        try:
+            super().dump_bytecode(bucket)
+        except OSError:
+            pass
+
+
+def _create_bytecode_cache() -> Optional[_BestEffortBytecodeCache]:
+    """
+    Create the cross-process bytecode cache in the per-user temp directory.
+    
+    Returns:
+        Bytecode cache, or None if no safe cache directory is available
+        (e.g., it is owned by another user or the platform has no uid)
+    """
+    try:
+        return _BestEffortBytecodeCache()
+    except (OSError, RuntimeError):
+        return None
+
+
 class Renderer:
     """
     Renderer for LaTeX CV templates.
@@ -25,7 +89,9 @@ class Renderer:
     
     Attributes:
         template: Name of the template package (e.g., "awesome_cv")
-        env: Jinja2 Environment instance
+        env: Jinja2 Environment instance (shared by all renderers
+            for the same template, and by render() and render_pdf():
+            filters or globals added to it apply to all of them)
     
     Examples:
         Basic usage:
@@ -44,7 +110,7 @@ class Renderer:
         List available document types:
         
         >>> renderer.list_document_types()
-        ['resume', 'cv', 'coverletter']
+        ['coverletter', 'cv', 'resume']
     """
     
     # Available template packages
@@ -82,10 +148,12 @@ class Renderer:
         
         self.template = template
         self.custom_template_dir = custom_template_dir
-        self.env = create_latex_environment(
-            template_loader=template if not custom_template_dir else None,
-            custom_template_dir=custom_template_dir,
+        self.env = _get_environment(
+            template if not custom_template_dir else None,
+            Path(custom_template_dir) if custom_template_dir else None,
         )
+        # Built-in document types, listed on first use (see list_document_types)
+        self._document_types: Optional[List[str]] = None
     
     def render(
         self,
@@ -118,16 +186,7 @@ class Renderer:
             >>> # Save directly to file
             >>> renderer.render("resume", data, output="resume.tex")
         """
-        template_name = f"{doc_type}.tex.j2"
-        
-        try:
-            template = self.env.get_template(template_name)
-        except TemplateNotFound as e:
-            available = self.list_document_types()
-            raise DocumentTypeNotFoundError(
-                f"Document type '{doc_type}' not found in template '{self.template}'. "
-                f"Available: {', '.join(available)}"
-            ) from e
+        template = self._get_template(doc_type)
         
         try:
             result = template.render(**data)
@@ -144,39 +203,105 @@ class Renderer:
         
         return result
     
+    def render_to_file(
+        self,
+        doc_type: str,
+        data: Dict[str, Any],
+        output: Union[str, Path],
+    ) -> Path:
+        """
+        Render document directly to a file.
+        
+        Unlike render(), the document is written in chunks while it is
+        rendered and never held in memory as a whole.
+        
+        Args:
+            doc_type: Type of document to render (resume, cv, coverletter)
+            data: Dictionary with document data
+            output: Path to save output file
+        
+        Returns:
+            Path to the written file
+        
+        Raises:
+            DocumentTypeNotFoundError: If document type template not found
+            RenderError: If rendering fails
+        
+        Examples:
+            >>> renderer = Renderer()
+            >>> renderer.render_to_file("resume", data, "resume.tex")
+            PosixPath('resume.tex')
+        """
+        template = self._get_template(doc_type)
+        
+        output_path = Path(output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        try:
+            template.stream(**data).dump(str(output_path), encoding='utf-8')
+        except Exception as e:
+            # Don't leave a partially written document behind
+            output_path.unlink(missing_ok=True)
+            raise RenderError(
+                f"Failed to render {doc_type} with template '{self.template}': {e}"
+            ) from e
+        
+        return output_path
+    
+    def _get_template(self, doc_type: str) -> Template:
+        """
+        Load the template for a document type.
+        
+        Raises:
+            DocumentTypeNotFoundError: If document type template not found
+        """
+        template_name = f"{doc_type}.tex.j2"
+        
+        try:
+            return self.env.get_template(template_name)
+        except TemplateNotFound as e:
+            available = self.list_document_types()
+            raise DocumentTypeNotFoundError(
+                f"Document type '{doc_type}' not found in template '{self.template}'. "
+                f"Available: {', '.join(available)}"
+            ) from e
+    
     def list_document_types(self) -> List[str]:
         """
         List available document types in current template.
         
-        Checks which .tex.j2 files are available in the template.
+        Lists the top-level .tex.j2 files of the template without
+        loading them. Built-in templates don't change, so they are only
+        listed once per renderer; custom template directories are listed
+        on every call.
         
         Returns:
-            List of available document type names
+            Sorted list of available document type names
         
         Examples:
             >>> renderer = Renderer()
             >>> types = renderer.list_document_types()
             >>> print(types)
-            ['resume', 'cv', 'coverletter']
+            ['coverletter', 'cv', 'resume']
             >>> 
             >>> # Check if specific type is available
             >>> if 'resume' in renderer.list_document_types():
             ...     print("Resume template available")
         """
-        available = []
-        
-        # Standard document types to check
-        standard_types = ["resume", "cv", "coverletter"]
-        
-        for doc_type in standard_types:
-            template_name = f"{doc_type}.tex.j2"
-            try:
-                self.env.get_template(template_name)
-                available.append(doc_type)
-            except TemplateNotFound:
-                pass
+        if self._document_types is not None:
+            return list(self._document_types)
         
-        return available
+        suffix = ".tex.j2"
+        document_types = sorted(
+            name[:-len(suffix)]
+            for name in self.env.list_templates()
+            # Templates in subdirectories (e.g. sections/) are includes
+            if name.endswith(suffix) and "/" not in name
+        )
+        if self.custom_template_dir is None:
+            self._document_types = document_types
+            return list(document_types)
+        return document_types
     
     def get_template_info(self) -> Dict[str, Any]:
         """
@@ -191,7 +316,7 @@ class Renderer:
             >>> print(info['name'])
             'awesome_cv'
             >>> print(info['document_types'])
-            ['resume', 'cv', 'coverletter']
+            ['coverletter', 'cv', 'resume']
         """
         return {
             'name': self.template,
@@ -209,7 +334,7 @@ def render(
     """
     Convenience function for quick rendering.
     
-    Creates a Renderer instance and renders document in one call.
+    Renders document in one call with a shared Renderer for the template.
     
     Args:
         data: Dictionary with document data
@@ -236,6 +361,19 @@ def render(
         
         >>> render(data, template="moderncv", doc_type="resume")
     """
-    renderer = Renderer(template=template)
-    return renderer.render(doc_type, data, output)
+    return _get_renderer(template).render(doc_type, data, output)
+
+
+@lru_cache(maxsize=8)
+def _get_renderer(template: str) -> Renderer:
+    """
+    Get a shared Renderer for a built-in template.
+    
+    Renderers hold no per-document state, so the convenience functions
+    (render(), render_pdf()) reuse one per template.
+    
+    Raises:
+        TemplateNotFoundError: If template is not available
+    """
+    return Renderer(template=template)
 
@@ -18,8 +18,9 @@ Examples:
     >>> data["skills"].append({"category": "Languages", "items": "English, Spanish"})
 """
 
-from typing import Literal
-import copy
+from functools import cache
+from types import MappingProxyType
+from typing import Any, Literal
 
 
 # Master data containing all fields for all document types
@@ -168,8 +169,54 @@ MASTER_DATA = {
 }
 
 
+# Fields of MASTER_DATA used only by the cover letter
+_COVERLETTER_ONLY_FIELDS = frozenset({
+    "recipient_name", "recipient_address",
+    "letter_title", "letter_opening", "letter_closing",
+    "letter_sections", "letter_enclosure", "header_alignment",
+})
+
+# Fields of MASTER_DATA used by each document type
+_RESUME_FIELDS = frozenset(MASTER_DATA) - _COVERLETTER_ONLY_FIELDS
+_CV_FIELDS = _RESUME_FIELDS
+_COVERLETTER_FIELDS = frozenset({
+    "first_name", "last_name", "position", "address",
+    "mobile", "email", "homepage", "github", "linkedin",
+}) | _COVERLETTER_ONLY_FIELDS
+
+
+def _clone(obj: Any) -> Any:
+    """
+    Deep copy sample data.
+    
+    Sample data only contains dicts, lists and immutable values, so only
+    the containers are copied; strings are shared. Much faster than
+    copy.deepcopy, which also dispatches on and memoizes every value.
+    """
+    if type(obj) is dict:
+        return {key: _clone(value) for key, value in obj.items()}
+    if type(obj) is list:
+        return [_clone(value) for value in obj]
+    return obj
+
+
+def _freeze(obj: Any) -> Any:
+    """Make a read-only copy of sample data: dicts become mapping proxies, lists tuples."""
+    if type(obj) is dict:
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    if type(obj) is list:
+        return tuple(_freeze(value) for value in obj)
+    return obj
+
+
+def _select(fields: frozenset) -> dict:
+    """Copy the given fields of MASTER_DATA (in MASTER_DATA order)."""
+    return {k: _clone(v) for k, v in MASTER_DATA.items() if k in fields}
+
+
 def load_sample(
-    doc_type: Literal["resume", "cv", "coverletter", "master"] = "resume"
+    doc_type: Literal["resume", "cv", "coverletter", "master"] = "resume",
+    mutable: bool = True,
 ) -> dict:
     """
     Load sample data for a specific document type.
@@ -180,10 +227,15 @@ def load_sample(
             - 'cv': Academic CV with skills, publications
             - 'coverletter': Cover letter with recipient info
             - 'master': Complete data with all fields
+        mutable: Return a fresh copy that can be modified (default: True).
+            If False, return a shared read-only view instead (dicts are
+            MappingProxyType, lists are tuples), which costs nothing
+            after the first call.
     
     Returns:
         Dictionary with sample data for the specified document type.
-        Returns a deep copy to avoid mutations of the original data.
+        Returns a deep copy to avoid mutations of the original data,
+        or a read-only view if mutable is False.
     
     Raises:
         ValueError: If doc_type is not recognized
@@ -203,21 +255,26 @@ def load_sample(
         >>> 
         >>> # Get all data
         >>> all_data = load_sample("master")
+        >>> 
+        >>> # Read-only data, e.g. for rendering many times
+        >>> resume = load_sample("resume", mutable=False)
     """
-    if doc_type == "resume":
-        return get_resume_data()
-    elif doc_type == "cv":
-        return get_cv_data()
-    elif doc_type == "coverletter":
-        return get_coverletter_data()
-    elif doc_type == "master":
-        return copy.deepcopy(MASTER_DATA)
-    else:
-        available = ["resume", "cv", "coverletter", "master"]
+    if not mutable:
+        return _frozen_sample(doc_type)
+    
+    factory = _SAMPLE_FACTORIES.get(doc_type)
+    if factory is None:
         raise ValueError(
             f"Unknown doc_type: '{doc_type}'. "
-            f"Available: {', '.join(available)}"
+            f"Available: {', '.join(_SAMPLE_FACTORIES)}"
         )
+    return factory()
+
+
+@cache
+def _frozen_sample(doc_type: str) -> MappingProxyType:
+    """Read-only sample data, created once per document type."""
+    return _freeze(load_sample(doc_type))
 
 
 def get_resume_data() -> dict:
@@ -235,7 +292,7 @@ def get_resume_data() -> dict:
         >>> data["sections"]
         {'summary': True, 'experience': True, 'education': True, ...}
     """
-    data = copy.deepcopy(MASTER_DATA)
+    data = _select(_RESUME_FIELDS)
     data["sections"] = {
         "summary": True,
         "experience": True,
@@ -243,8 +300,6 @@ def get_resume_data() -> dict:
         "honors": True,
         "certificates": True,
     }
-    # Remove cover letter specific fields
-    data.pop("header_alignment", None)
     return data
 
 
@@ -264,15 +319,13 @@ def get_cv_data() -> dict:
         >>> len(data["skills"])
         3
     """
-    data = copy.deepcopy(MASTER_DATA)
+    data = _select(_CV_FIELDS)
     data["sections"] = {
         "education": True,
         "skills": True,
         "experience": True,
         "honors": True,
     }
-    # Remove cover letter specific fields
-    data.pop("header_alignment", None)
     return data
 
 
@@ -291,19 +344,8 @@ def get_coverletter_data() -> dict:
         >>> data["recipient_name"]
         'Engineering Team'
     """
-    # Cover letter only needs specific fields
-    data = copy.deepcopy(MASTER_DATA)
-    
-    # Keep only relevant fields for cover letter
-    relevant_fields = [
-        "first_name", "last_name", "position", "address",
-        "mobile", "email", "homepage", "github", "linkedin",
-        "recipient_name", "recipient_address",
-        "letter_title", "letter_opening", "letter_closing",
-        "letter_sections", "letter_enclosure", "header_alignment",
-    ]
-    
-    return {k: v for k, v in data.items() if k in relevant_fields}
+    # Cover letter only needs specific fields: copy just those
+    return _select(_COVERLETTER_FIELDS)
 
 
 def get_master_data() -> dict:
@@ -330,11 +372,37 @@ def get_master_data() -> dict:
         ...     }
         ... }
     """
-    return copy.deepcopy(MASTER_DATA)
+    return _clone(MASTER_DATA)
+
+
+# Sample data factories by document type (used by load_sample)
+_SAMPLE_FACTORIES = {
+    "resume": get_resume_data,
+    "cv": get_cv_data,
+    "coverletter": get_coverletter_data,
+    "master": get_master_data,
+}
 
 
 # Convenience exports for backward compatibility and quick access
-resume_data = get_resume_data()
-cv_data = get_cv_data()
-coverletter_data = get_coverletter_data()
+# (resume_data, cv_data, coverletter_data), created on first access
+_LAZY_SAMPLES = {
+    "resume_data": get_resume_data,
+    "cv_data": get_cv_data,
+    "coverletter_data": get_coverletter_data,
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Create sample data exports on first access."""
+    factory = _LAZY_SAMPLES.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = factory()
+    globals()[name] = value  # Cache: later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_SAMPLES))
 
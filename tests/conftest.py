@@ -7,49 +7,72 @@ Provides sample data fixtures for all tests.
 import pytest
 from pathlib import Path
 
+from awesomecv_jinja import Renderer
+from awesomecv_jinja.samples import load_sample, _clone
+
+
+@pytest.fixture(scope="session")
+def _samples():
+    """
+    Sample data for all document types, loaded once per test session.
+    
+    Tests must not use these directly: use the per-test fixtures below,
+    which return copies.
+    """
+    return {
+        doc_type: load_sample(doc_type)
+        for doc_type in ["resume", "cv", "coverletter", "master"]
+    }
+
 
 @pytest.fixture
-def resume_data():
+def resume_data(_samples):
     """
     Sample resume data for testing.
     
     Returns a fresh copy for each test to avoid mutations.
     """
-    from awesomecv_jinja.samples import load_sample
-    return load_sample("resume")
+    return _clone(_samples["resume"])
 
 
 @pytest.fixture
-def cv_data():
+def cv_data(_samples):
     """
     Sample CV data for testing.
     
     Returns a fresh copy for each test to avoid mutations.
     """
-    from awesomecv_jinja.samples import load_sample
-    return load_sample("cv")
+    return _clone(_samples["cv"])
 
 
 @pytest.fixture
-def coverletter_data():
+def coverletter_data(_samples):
     """
     Sample cover letter data for testing.
     
     Returns a fresh copy for each test to avoid mutations.
     """
-    from awesomecv_jinja.samples import load_sample
-    return load_sample("coverletter")
+    return _clone(_samples["coverletter"])
 
 
 @pytest.fixture
-def master_data():
+def master_data(_samples):
     """
     Complete master data with all fields.
     
     Returns a fresh copy for each test to avoid mutations.
     """
-    from awesomecv_jinja.samples import get_master_data
-    return get_master_data()
+    return _clone(_samples["master"])
+
+
+# Minimal document data, copied by the base_data fixture
+_BASE_DATA = {
+    "first_name": "John",
+    "last_name": "Doe",
+    "position": "Engineer",
+    "email": "john@example.com",
+    "sections": {},
+}
 
 
 @pytest.fixture
@@ -59,13 +82,19 @@ def base_data():
     
     Useful for testing with minimal setup.
     """
-    return {
-        "first_name": "John",
-        "last_name": "Doe",
-        "position": "Engineer",
-        "email": "john@example.com",
-        "sections": {},
-    }
+    data = _BASE_DATA.copy()
+    data["sections"] = {}  # Fresh dict: tests may add sections
+    return data
+
+
+@pytest.fixture(scope="session")
+def renderer():
+    """
+    Renderer for the default awesome_cv template, shared by all tests.
+    
+    Renderers hold no per-render state, so one instance can be reused.
+    """
+    return Renderer()
 
 
 @pytest.fixture
@@ -4,72 +4,78 @@ Integration tests for pipeline API (render_pdf).
 These tests verify the complete data → PDF pipeline.
 """
 
+import os
+import shutil
+import tempfile
 import pytest
 from pathlib import Path
 
-from awesomecv_jinja import render_pdf
+from awesomecv_jinja import render_pdf, render_pdfs
 from awesomecv_jinja.exceptions import CompilationError
 
+# Looked up once per test run: shutil.which stats every PATH entry
+_HAS_XELATEX = shutil.which("xelatex") is not None
+_HAS_DOCKER = shutil.which("docker") is not None
+
+
+@pytest.fixture(scope="session")
+def rendered_resume(tmp_path_factory):
+    """
+    Resume compiled once per test session with keep_tex=True.
+    
+    Compiling takes seconds, so tests that only inspect the result share it.
+    Skips dependent tests if no compilation engine is available.
+    """
+    from awesomecv_jinja import load_sample
+    
+    output = tmp_path_factory.mktemp("pdf") / "resume.pdf"
+    try:
+        return render_pdf(load_sample("resume"), output=output, keep_tex=True)
+    except CompilationError:
+        pytest.skip("No PDF compilation engine available")
+
 
 class TestRenderPDF:
     """Tests for render_pdf function"""
     
-    def test_render_pdf_creates_file(self, resume_data, tmp_render_dir):
+    def test_render_pdf_creates_file(self, rendered_resume):
         """render_pdf creates PDF file"""
-        output = tmp_render_dir / "test.pdf"
-        
-        try:
-            pdf = render_pdf(resume_data, output=output)
-            
-            # PDF should be created
-            assert pdf.exists()
-            assert pdf.suffix == ".pdf"
-            assert pdf.stat().st_size > 0
+        pdf = rendered_resume
         
-        except CompilationError:
-            # Expected if no LaTeX/Docker available
-            pytest.skip("No PDF compilation engine available")
+        # PDF should be created
+        assert pdf.exists()
+        assert pdf.suffix == ".pdf"
+        assert pdf.stat().st_size > 0
     
-    def test_render_pdf_with_keep_tex(self, resume_data, tmp_render_dir):
+    def test_render_pdf_with_keep_tex(self, rendered_resume):
         """render_pdf with keep_tex=True saves both tex and pdf"""
-        output = tmp_render_dir / "test.pdf"
+        pdf = rendered_resume
+        tex = pdf.with_suffix(".tex")
         
-        try:
-            pdf = render_pdf(resume_data, output=output, keep_tex=True)
-            tex = pdf.with_suffix(".tex")
-            
-            # Both should exist
-            assert pdf.exists()
-            assert tex.exists()
-            assert tex.stat().st_size > 0
-        
-        except CompilationError:
-            pytest.skip("No PDF compilation engine available")
+        # Both should exist
+        assert pdf.exists()
+        assert tex.exists()
+        assert tex.stat().st_size > 0
     
-    def test_render_pdf_different_doc_types(self, resume_data, cv_data, tmp_render_dir):
+    def test_render_pdf_different_doc_types(self, rendered_resume, cv_data, tmp_render_dir):
         """Can render different document types to PDF"""
         try:
-            # Resume
-            resume_pdf = render_pdf(
-                resume_data,
-                doc_type="resume",
-                output=tmp_render_dir / "resume.pdf"
-            )
-            assert resume_pdf.exists()
-            
-            # CV
+            # CV (the resume is compiled once by the rendered_resume fixture)
             cv_pdf = render_pdf(
                 cv_data,
                 doc_type="cv",
-                output=tmp_render_dir / "cv.pdf"
+                output=tmp_render_dir / "cv.pdf",
+                keep_tex=True,
             )
-            assert cv_pdf.exists()
-            
-            # Different sizes (different content)
-            assert resume_pdf.stat().st_size != cv_pdf.stat().st_size
-        
         except CompilationError:
             pytest.skip("No PDF compilation engine available")
+        
+        assert cv_pdf.exists()
+        
+        # Different LaTeX sources (different content)
+        resume_tex = rendered_resume.with_suffix(".tex").read_text(encoding="utf-8")
+        cv_tex = cv_pdf.with_suffix(".tex").read_text(encoding="utf-8")
+        assert resume_tex != cv_tex
     
     def test_render_pdf_creates_output_directory(self, resume_data, tmp_path):
         """Creates output directory if it doesn't exist"""
@@ -85,11 +91,216 @@ class TestRenderPDF:
             pytest.skip("No PDF compilation engine available")
 
 
+class TestScratchDir:
+    """Tests for choosing the temporary compilation directory"""
+    
+    @pytest.fixture
+    def no_temp_config(self, monkeypatch):
+        """Clear any temporary directory configuration"""
+        for name in ["TMPDIR", "TEMP", "TMP"]:
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setattr(tempfile, "tempdir", None)
+    
+    def test_tmpdir_takes_precedence(self, no_temp_config, monkeypatch, tmp_path):
+        """TMPDIR overrides the RAM-backed directory"""
+        from awesomecv_jinja.pipeline import _scratch_dir_base
+        
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+        assert _scratch_dir_base() is None
+    
+    def test_tempfile_tempdir_takes_precedence(self, no_temp_config, monkeypatch, tmp_path):
+        """tempfile.tempdir overrides the RAM-backed directory"""
+        from awesomecv_jinja.pipeline import _scratch_dir_base
+        
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        assert _scratch_dir_base() is None
+    
+    @pytest.mark.skipif(
+        not (os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK)),
+        reason="/dev/shm not available",
+    )
+    def test_shm_used_by_default(self, no_temp_config):
+        """/dev/shm is used when no temporary directory is configured"""
+        from awesomecv_jinja.pipeline import _scratch_dir_base
+        
+        assert _scratch_dir_base() == "/dev/shm"
+        tempfile.gettempdir()  # Stores the default in tempfile.tempdir
+        assert _scratch_dir_base() == "/dev/shm"
+    
+    @pytest.mark.skipif(_HAS_XELATEX, reason="xelatex is available")
+    def test_failed_build_reports_kept_files(self, resume_data, tmp_path, monkeypatch):
+        """The error says where the files of a failed build are kept"""
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        
+        with pytest.raises(CompilationError, match="Build files kept in: ") as e:
+            render_pdf(resume_data, output=tmp_path / "resume.pdf", engine="xelatex")
+        
+        kept = Path(str(e.value).rsplit("Build files kept in: ", 1)[1])
+        assert kept.parent == tmp_path
+        assert (kept / "document.tex").exists()
+
+
+class TestRenderPDFs:
+    """Tests for render_pdfs function"""
+    
+    def test_render_pdfs_empty_jobs(self):
+        """Returns empty list for empty job list"""
+        assert render_pdfs([]) == []
+    
+    def test_render_pdfs_preserves_order(self, resume_data, cv_data, tmp_render_dir):
+        """Returns PDF paths in job order"""
+        jobs = [
+            {"data": resume_data, "output": tmp_render_dir / "resume.pdf"},
+            {"data": cv_data, "doc_type": "cv", "output": tmp_render_dir / "cv.pdf"},
+        ]
+        
+        try:
+            pdfs = render_pdfs(jobs, max_workers=2)
+        except CompilationError:
+            pytest.skip("No PDF compilation engine available")
+        
+        assert pdfs == [tmp_render_dir / "resume.pdf", tmp_render_dir / "cv.pdf"]
+        assert all(pdf.exists() for pdf in pdfs)
+    
+    def test_render_pdfs_read_only_data(self, tmp_render_dir):
+        """Accepts read-only sample data, which can't be pickled as is"""
+        from awesomecv_jinja import load_sample
+        
+        jobs = [{
+            "data": load_sample("resume", mutable=False),
+            "output": tmp_render_dir / "resume.pdf",
+        }]
+        
+        try:
+            pdfs = render_pdfs(jobs, max_workers=1)
+        except CompilationError:
+            pytest.skip("No PDF compilation engine available")
+        
+        assert pdfs == [tmp_render_dir / "resume.pdf"]
+
+
+class TestPlainData:
+    """Tests for preparing job data for worker processes"""
+    
+    def test_read_only_sample_can_be_pickled(self):
+        """Read-only samples cross process boundaries intact"""
+        import pickle
+        from awesomecv_jinja import load_sample, render
+        from awesomecv_jinja.pipeline import _plain_data
+        
+        data = pickle.loads(pickle.dumps(_plain_data(load_sample("resume", mutable=False))))
+        assert render(data) == render(load_sample("resume"))
+
+
+class TestRenderPDFCache:
+    """Tests for render_pdf(cache=True)"""
+    
+    @pytest.fixture(autouse=True)
+    def cache_home(self, tmp_path, monkeypatch):
+        """Keep cached PDFs in a temporary directory"""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        return tmp_path / "cache"
+    
+    def test_cache_key_depends_on_engine(self, resume_data, tmp_path):
+        """Same LaTeX compiled by different engines is cached separately"""
+        from awesomecv_jinja import Renderer
+        from awesomecv_jinja.pipeline import _cached_pdf_path
+        
+        tex_file = Renderer().render_to_file("resume", resume_data, tmp_path / "a.tex")
+        
+        assert _cached_pdf_path(tex_file, "awesome_cv", "xelatex") == \
+            _cached_pdf_path(tex_file, "awesome_cv", "xelatex")
+        assert _cached_pdf_path(tex_file, "awesome_cv", "xelatex") != \
+            _cached_pdf_path(tex_file, "awesome_cv", "docker")
+    
+    def test_cache_hit_skips_compilation(self, resume_data, tmp_path):
+        """Cached PDF is copied to output without compiling"""
+        from awesomecv_jinja import Renderer
+        from awesomecv_jinja.pipeline import _cached_pdf_path
+        
+        tex_file = Renderer().render_to_file("resume", resume_data, tmp_path / "a.tex")
+        cached_pdf = _cached_pdf_path(tex_file, "awesome_cv", "xelatex")
+        cached_pdf.parent.mkdir(parents=True)
+        cached_pdf.write_bytes(b"%PDF-cached")
+        
+        output = tmp_path / "out" / "resume.pdf"
+        pdf = render_pdf(resume_data, output=output, engine="xelatex", cache=True)
+        
+        assert pdf == output
+        assert output.read_bytes() == b"%PDF-cached"
+        assert cached_pdf.exists()
+    
+    def test_cache_stores_compiled_pdf(self, resume_data, tmp_path, cache_home):
+        """Compiled PDF is stored and reused by the next build"""
+        try:
+            first = render_pdf(resume_data, output=tmp_path / "first.pdf", cache=True)
+        except CompilationError:
+            pytest.skip("No PDF compilation engine available")
+        
+        second = render_pdf(resume_data, output=tmp_path / "second.pdf", cache=True)
+        
+        assert len(list(cache_home.rglob("*.pdf"))) == 1
+        assert second.read_bytes() == first.read_bytes()
+
+
+    @pytest.fixture
+    def compiles(self, monkeypatch):
+        """Replace compilation with writing a fake PDF; records compiled files"""
+        from awesomecv_jinja.compiler import PDFCompiler
+        
+        compiled = []
+        
+        def fake_compile_file(self, tex_file, output=None, keep_artifacts=False):
+            compiled.append(tex_file)
+            pdf_file = Path(tex_file).with_suffix(".pdf")
+            pdf_file.write_bytes(b"%PDF-" + str(len(compiled)).encode())
+            return pdf_file
+        
+        monkeypatch.setattr(PDFCompiler, "compile_file", fake_compile_file)
+        return compiled
+    
+    def test_changed_photo_is_recompiled(self, resume_data, tmp_path, compiles):
+        """Replacing the photo file invalidates the cached PDF"""
+        photo = tmp_path / "profile.png"
+        photo.write_bytes(b"old photo")
+        resume_data["photo"] = str(tmp_path / "profile")
+        output = tmp_path / "resume.pdf"
+        
+        render_pdf(resume_data, output=output, engine="xelatex", cache=True)
+        render_pdf(resume_data, output=output, engine="xelatex", cache=True)
+        assert len(compiles) == 1
+        
+        photo.write_bytes(b"new photo")
+        render_pdf(resume_data, output=output, engine="xelatex", cache=True)
+        assert len(compiles) == 2
+        assert output.read_bytes() == b"%PDF-2"
+    
+    def test_cache_key_depends_on_build_dir(self, resume_data, tmp_path):
+        """Builds next to the output and in a temporary directory are cached separately"""
+        from awesomecv_jinja import Renderer
+        from awesomecv_jinja.pipeline import _cached_pdf_path
+        
+        tex_file = Renderer().render_to_file("resume", resume_data, tmp_path / "a.tex")
+        
+        assert _cached_pdf_path(tex_file, "awesome_cv", "xelatex") != \
+            _cached_pdf_path(tex_file, "awesome_cv", "xelatex", build_dir=tmp_path)
+    
+    def test_photo_files_resolve_options_and_extensions(self, tmp_path):
+        """Photo values with options and without extension find the image"""
+        from awesomecv_jinja.pipeline import _photo_files
+        
+        (tmp_path / "profile.jpg").write_bytes(b"photo")
+        
+        assert _photo_files("[circle,noedge,left]{./profile}", tmp_path) == \
+            [(tmp_path / "profile.jpg").resolve()]
+        assert _photo_files("missing.png", tmp_path) == []
+
+
 class TestRenderPDFEngines:
     """Tests for different compilation engines"""
     
     @pytest.mark.skipif(
-        __import__('shutil').which("xelatex") is None,
+        not _HAS_XELATEX,
         reason="xelatex not installed"
     )
     def test_render_pdf_with_xelatex(self, resume_data, tmp_render_dir):
@@ -107,7 +318,7 @@ class TestRenderPDFEngines:
             pytest.skip("LaTeX compilation failed (missing packages)")
     
     @pytest.mark.skipif(
-        __import__('shutil').which("docker") is None,
+        not _HAS_DOCKER,
         reason="docker not installed"
     )
     def test_render_pdf_with_docker(self, resume_data, tmp_render_dir):
@@ -39,6 +39,14 @@ class TestLoadSample:
         assert "recipient_name" in data
         assert "letter_sections" in data
     
+    def test_resume_and_cv_exclude_coverletter_fields(self):
+        """Resume and CV data don't carry cover letter only fields"""
+        for doc_type in ["resume", "cv"]:
+            data = load_sample(doc_type)
+            assert "recipient_name" not in data
+            assert "letter_sections" not in data
+            assert "header_alignment" not in data
+    
     def test_load_master_data(self):
         """Can load master data with all fields"""
         data = load_sample("master")
@@ -65,6 +73,38 @@ class TestLoadSample:
         
         # Should not affect the other
         assert data2["first_name"] == "John"
+    
+    def test_read_only_sample_matches_copy(self):
+        """Read-only sample has the same content as a mutable copy"""
+        frozen = load_sample("resume", mutable=False)
+        data = load_sample("resume")
+        
+        assert frozen.keys() == data.keys()
+        assert frozen["first_name"] == data["first_name"]
+        assert list(frozen["experience"][0]["details"]) == data["experience"][0]["details"]
+    
+    def test_read_only_sample_is_shared_and_immutable(self):
+        """Read-only sample is created once and can't be modified"""
+        frozen = load_sample("cv", mutable=False)
+        
+        assert load_sample("cv", mutable=False) is frozen
+        with pytest.raises(TypeError):
+            frozen["first_name"] = "Jane"
+        with pytest.raises(TypeError):
+            frozen["sections"]["skills"] = False
+    
+    def test_read_only_sample_renders_like_copy(self):
+        """Templates render read-only samples the same way"""
+        from awesomecv_jinja import render
+        
+        for doc_type in ["resume", "cv", "coverletter"]:
+            assert render(load_sample(doc_type, mutable=False), doc_type=doc_type) == \
+                render(load_sample(doc_type), doc_type=doc_type)
+    
+    def test_read_only_invalid_doc_type_raises_error(self):
+        """Raises ValueError for invalid document type"""
+        with pytest.raises(ValueError, match="Unknown doc_type"):
+            load_sample("invalid", mutable=False)
 
 
 class TestGetMasterData:
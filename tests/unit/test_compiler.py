@@ -4,12 +4,19 @@ Tests for compiler module.
 Tests PDF compilation functionality.
 """
 
+import atexit
+import os
+import shutil
+import subprocess
+import time
 import pytest
-from pathlib import Path
 
-from awesomecv_jinja.compiler import PDFCompiler, CompilationEngine
+from awesomecv_jinja.compiler import PDFCompiler, CompilationEngine, _move_file
 from awesomecv_jinja.exceptions import CompilationError
 
+# Looked up once per test run: shutil.which stats every PATH entry
+_HAS_XELATEX = shutil.which("xelatex") is not None
+
 
 class TestCompilationEngine:
     """Tests for CompilationEngine enum"""
@@ -18,6 +25,7 @@ class TestCompilationEngine:
         """All engines have correct values"""
         assert CompilationEngine.AUTO.value == "auto"
         assert CompilationEngine.XELATEX.value == "xelatex"
+        assert CompilationEngine.LATEXMK.value == "latexmk"
         assert CompilationEngine.DOCKER.value == "docker"
         assert CompilationEngine.DOCKER_SUDO.value == "docker-sudo"
 
@@ -40,6 +48,188 @@ class TestPDFCompilerInit:
         """Can specify custom timeout"""
         compiler = PDFCompiler(timeout=120)
         assert compiler.timeout == 120
+    
+    def test_init_with_engine_member(self):
+        """Accepts CompilationEngine members as well as names"""
+        compiler = PDFCompiler(engine=CompilationEngine.LATEXMK)
+        assert compiler.engine == CompilationEngine.LATEXMK
+    
+    def test_init_with_unknown_engine_raises_error(self):
+        """Raises ValueError for unknown engine names"""
+        with pytest.raises(ValueError):
+            PDFCompiler(engine="pdflatex")
+    
+    def test_init_docker_warm_disabled_by_default(self):
+        """Warm Docker containers are opt-in"""
+        compiler = PDFCompiler()
+        assert compiler.docker_warm is False
+    
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX only")
+    def test_docker_runs_as_current_user(self):
+        """Docker containers run with the current uid:gid"""
+        compiler = PDFCompiler(engine="docker")
+        assert compiler._docker_user_args == ["--user", f"{os.getuid()}:{os.getgid()}"]
+
+
+class TestPDFCompilerDockerWarm:
+    """Tests for compiling in warm Docker containers"""
+    
+    @pytest.fixture
+    def calls(self, monkeypatch):
+        """Record subprocess.run commands; docker exec writes the PDF"""
+        calls = []
+        
+        def fake_run(cmd, *args, **kwargs):
+            calls.append(cmd)
+            if "exec" in cmd:
+                (kwargs["cwd"] / cmd[-1]).with_suffix(".pdf").write_text("pdf")
+            return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+        
+        monkeypatch.setattr(subprocess, "run", fake_run)
+        return calls
+    
+    @pytest.fixture
+    def tex_files(self, tmp_path):
+        """Two .tex files in different directories"""
+        files = []
+        for name in ["a", "b"]:
+            (tmp_path / name).mkdir()
+            tex_file = tmp_path / name / "test.tex"
+            tex_file.write_text("test")
+            files.append(tex_file)
+        return files
+    
+    def test_one_container_per_directory(self, calls, tex_files):
+        """Starts one container per directory and execs each compile"""
+        first, second = tex_files
+        
+        with PDFCompiler(engine="docker", docker_warm=True) as compiler:
+            compiler._compile_with_docker(first)
+            compiler._compile_with_docker(first)
+            compiler._compile_with_docker(second)
+            started = [cmd[cmd.index("--name") + 1] for cmd in calls if "-d" in cmd]
+        
+        assert len(started) == 2
+        assert [cmd[:2] for cmd in calls if "exec" in cmd] == [["docker", "exec"]] * 3
+        removed = [cmd[-1] for cmd in calls if cmd[:3] == ["docker", "rm", "-f"]]
+        assert sorted(removed) == sorted(started)
+    
+    def test_close_without_containers(self, calls):
+        """close() runs nothing when no container was started"""
+        with PDFCompiler(engine="docker", docker_warm=True) as compiler:
+            pass
+        compiler.close()
+        
+        assert calls == []
+    
+    def test_close_removes_containers_once(self, calls, tex_files):
+        """close() removes the containers; closing again does nothing"""
+        compiler = PDFCompiler(engine="docker", docker_warm=True)
+        compiler._compile_with_docker(tex_files[0])
+        
+        compiler.close()
+        compiler.close()
+        
+        assert len([cmd for cmd in calls if cmd[:3] == ["docker", "rm", "-f"]]) == 1
+    
+    def test_sudo_refreshed_before_container_start(self, calls, tex_files):
+        """docker-sudo checks sudo credentials before the first sudo docker call"""
+        with PDFCompiler(engine="docker-sudo", docker_warm=True) as compiler:
+            compiler._compile_with_docker(tex_files[0], use_sudo=True)
+        
+        assert calls[0] == ["sudo", "-nv"]
+        assert calls[1][:4] == ["sudo", "docker", "run", "-d"]
+        assert calls[2][:3] == ["sudo", "docker", "exec"]
+        assert calls[3][:4] == ["sudo", "docker", "rm", "-f"]
+    
+    def test_exit_handler_registered_once(self, calls, tex_files, monkeypatch):
+        """The exit handler is registered while containers run, and removed by close()"""
+        registered = []
+        monkeypatch.setattr(atexit, "register", registered.append)
+        monkeypatch.setattr(atexit, "unregister", registered.remove)
+        compiler = PDFCompiler(engine="docker", docker_warm=True)
+        
+        compiler._compile_with_docker(tex_files[0])
+        compiler._compile_with_docker(tex_files[1])
+        assert registered == [compiler.close]
+        
+        compiler.close()
+        assert registered == []
+        
+        compiler._compile_with_docker(tex_files[0])
+        assert registered == [compiler.close]
+        compiler.close()
+
+
+class TestPDFCompilerRefreshSudo:
+    """Tests for checking sudo credentials before docker-sudo runs"""
+    
+    @pytest.fixture
+    def sudo(self, monkeypatch):
+        """Record sudo commands; return codes are taken from sudo.returncodes"""
+        def fake_run(cmd, *args, **kwargs):
+            fake_run.calls.append(cmd)
+            returncode = fake_run.returncodes.pop(0)
+            if isinstance(returncode, Exception):
+                raise returncode
+            return subprocess.CompletedProcess(cmd, returncode)
+        
+        fake_run.calls = []
+        fake_run.returncodes = []
+        monkeypatch.setattr(subprocess, "run", fake_run)
+        return fake_run
+    
+    def test_cached_credentials_skip_prompt(self, sudo):
+        """sudo -v is not run when sudo -nv succeeds"""
+        sudo.returncodes = [0]
+        PDFCompiler()._refresh_sudo()
+        assert sudo.calls == [["sudo", "-nv"]]
+    
+    def test_stale_credentials_are_refreshed(self, sudo):
+        """sudo -v runs when sudo -nv fails"""
+        sudo.returncodes = [1, 0]
+        PDFCompiler()._refresh_sudo()
+        assert sudo.calls == [["sudo", "-nv"], ["sudo", "-v"]]
+    
+    def test_successful_check_is_reused(self, sudo):
+        """No sudo call within _SUDO_REFRESH_INTERVAL of a successful check"""
+        sudo.returncodes = [0]
+        compiler = PDFCompiler()
+        compiler._refresh_sudo()
+        compiler._refresh_sudo()
+        assert sudo.calls == [["sudo", "-nv"]]
+    
+    def test_check_repeated_after_interval(self, sudo, monkeypatch):
+        """Credentials are checked again once the interval has passed"""
+        from awesomecv_jinja import compiler as compiler_module
+        
+        sudo.returncodes = [0, 0]
+        compiler = PDFCompiler()
+        compiler._refresh_sudo()
+        now = time.monotonic() + compiler_module._SUDO_REFRESH_INTERVAL
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+        compiler._refresh_sudo()
+        assert sudo.calls == [["sudo", "-nv"], ["sudo", "-nv"]]
+    
+    def test_failed_refresh_is_not_remembered(self, sudo):
+        """A failed refresh is retried on the next call"""
+        sudo.returncodes = [1, 1, 0]
+        compiler = PDFCompiler()
+        compiler._refresh_sudo()
+        compiler._refresh_sudo()
+        assert sudo.calls == [["sudo", "-nv"], ["sudo", "-v"], ["sudo", "-nv"]]
+    
+    @pytest.mark.parametrize("error", [
+        OSError("sudo not found"),
+        subprocess.TimeoutExpired(["sudo", "-nv"], 2),
+    ])
+    def test_errors_are_ignored_and_retried(self, sudo, error):
+        """Missing sudo or a timeout doesn't raise and isn't remembered"""
+        sudo.returncodes = [error, 0]
+        compiler = PDFCompiler()
+        compiler._refresh_sudo()
+        compiler._refresh_sudo()
+        assert sudo.calls == [["sudo", "-nv"], ["sudo", "-nv"]]
 
 
 class TestPDFCompilerAvailability:
@@ -51,6 +241,12 @@ class TestPDFCompilerAvailability:
         result = compiler.is_available(CompilationEngine.XELATEX)
         assert isinstance(result, bool)
     
+    def test_is_available_latexmk(self):
+        """Can check if latexmk is available"""
+        compiler = PDFCompiler()
+        result = compiler.is_available(CompilationEngine.LATEXMK)
+        assert isinstance(result, bool)
+    
     def test_is_available_docker(self):
         """Can check if docker is available"""
         compiler = PDFCompiler()
@@ -80,25 +276,143 @@ class TestPDFCompilerCompile:
         with pytest.raises(FileNotFoundError, match="not found"):
             compiler.compile_file("nonexistent.tex")
     
-    def test_compile_file_with_invalid_engine_raises_error(self):
+    def test_compile_file_with_invalid_engine_raises_error(self, tmp_path):
         """Raises CompilationError if specified engine not available"""
-        import shutil
-        
         compiler = PDFCompiler(engine="xelatex")
         
         # Only test if xelatex is actually not available
-        if not shutil.which("xelatex"):
+        if not _HAS_XELATEX:
             # Create dummy tex file
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.tex', delete=False) as f:
-                f.write("\\documentclass{article}\\begin{document}test\\end{document}")
-                tex_file = f.name
+            tex_file = tmp_path / "test.tex"
+            tex_file.write_text("\\documentclass{article}\\begin{document}test\\end{document}")
             
-            try:
-                with pytest.raises(CompilationError, match="not available"):
-                    compiler.compile_file(tex_file)
-            finally:
-                Path(tex_file).unlink(missing_ok=True)
+            with pytest.raises(CompilationError, match="not available"):
+                compiler.compile_file(tex_file)
+
+
+class TestPDFCompilerXelatex:
+    """Tests for compiling with local xelatex"""
+    
+    @pytest.fixture
+    def tex_file(self, tmp_path):
+        """A .tex file to compile"""
+        tex_file = tmp_path / "test.tex"
+        tex_file.write_text("test")
+        return tex_file
+    
+    def fake_xelatex(self, monkeypatch, logs):
+        """Mock subprocess.run: each run writes the PDF and the next log"""
+        calls = []
+        
+        def fake_run(cmd, *args, **kwargs):
+            calls.append(cmd)
+            tex_file = kwargs["cwd"] / cmd[-1]
+            tex_file.with_suffix(".log").write_bytes(logs[len(calls) - 1])
+            tex_file.with_suffix(".pdf").write_text("pdf")
+            return subprocess.CompletedProcess(cmd, 0)
+        
+        monkeypatch.setattr(subprocess, "run", fake_run)
+        return calls
+    
+    def test_runs_once_for_clean_log(self, tex_file, monkeypatch):
+        """Runs xelatex once if the log doesn't ask for a rerun"""
+        calls = self.fake_xelatex(monkeypatch, [b"Output written on test.pdf\n"])
+        
+        assert PDFCompiler()._compile_with_xelatex(tex_file) == tex_file.with_suffix(".pdf")
+        assert calls == [
+            ["xelatex", "-interaction=nonstopmode", "-no-shell-escape", "test.tex"]
+        ]
+    
+    def test_reruns_until_log_is_clean(self, tex_file, monkeypatch):
+        """Reruns xelatex while the log asks for it"""
+        calls = self.fake_xelatex(
+            monkeypatch, [b"Rerun to get cross-references right.\n", b"done\n"]
+        )
+        
+        PDFCompiler()._compile_with_xelatex(tex_file)
+        assert len(calls) == 2
+    
+    def test_stops_after_max_runs(self, tex_file, monkeypatch):
+        """Gives up rerunning after _MAX_XELATEX_RUNS runs"""
+        from awesomecv_jinja.compiler import _MAX_XELATEX_RUNS
+        
+        calls = self.fake_xelatex(
+            monkeypatch, [b"Rerun to get cross-references right.\n"] * 10
+        )
+        
+        PDFCompiler()._compile_with_xelatex(tex_file)
+        assert len(calls) == _MAX_XELATEX_RUNS == 3
+        assert all("-no-shell-escape" in cmd for cmd in calls)
+    
+    def test_missing_pdf_raises_error(self, tex_file, monkeypatch):
+        """Raises CompilationError with the LaTeX error if no PDF is written"""
+        def fake_run(cmd, *args, **kwargs):
+            (kwargs["cwd"] / "test.log").write_text("! Undefined control sequence.\n")
+            return subprocess.CompletedProcess(cmd, 1)
+        
+        monkeypatch.setattr(subprocess, "run", fake_run)
+        
+        with pytest.raises(CompilationError, match="Undefined control sequence"):
+            PDFCompiler()._compile_with_xelatex(tex_file)
+
+
+class TestPDFCompilerLatexmk:
+    """Tests for compiling with local latexmk"""
+    
+    def test_runs_latexmk_with_xelatex(self, tmp_path, monkeypatch):
+        """Runs latexmk once with xelatex and without shell escape"""
+        tex_file = tmp_path / "test.tex"
+        tex_file.write_text("test")
+        calls = []
+        
+        def fake_run(cmd, *args, **kwargs):
+            calls.append(cmd)
+            (kwargs["cwd"] / "test.pdf").write_text("pdf")
+            return subprocess.CompletedProcess(cmd, 0)
+        
+        monkeypatch.setattr(subprocess, "run", fake_run)
+        
+        assert PDFCompiler()._compile_with_latexmk(tex_file) == tmp_path / "test.pdf"
+        assert calls == [[
+            "latexmk", "-xelatex", "-interaction=nonstopmode", "-no-shell-escape", "test.tex"
+        ]]
+    
+    def test_missing_pdf_raises_error(self, tmp_path, monkeypatch):
+        """Raises CompilationError with the LaTeX error if no PDF is written"""
+        tex_file = tmp_path / "test.tex"
+        tex_file.write_text("test")
+        
+        def fake_run(cmd, *args, **kwargs):
+            (kwargs["cwd"] / "test.log").write_text("! Undefined control sequence.\n")
+            return subprocess.CompletedProcess(cmd, 12)
+        
+        monkeypatch.setattr(subprocess, "run", fake_run)
+        
+        with pytest.raises(CompilationError, match="latexmk compilation failed"):
+            PDFCompiler()._compile_with_latexmk(tex_file)
+
+
+class TestPDFCompilerRerun:
+    """Tests for detecting required xelatex reruns"""
+    
+    def test_needs_rerun_when_log_asks(self, tmp_path):
+        """Detects the rerun warning in the log"""
+        log_file = tmp_path / "test.log"
+        log_file.write_bytes(
+            b"LaTeX Warning: Label(s) may have changed. "
+            b"Rerun to get cross-references right.\n"
+        )
+        assert PDFCompiler()._needs_rerun(log_file) is True
+    
+    def test_no_rerun_for_clean_log(self, tmp_path):
+        """No rerun for a log without the warning"""
+        log_file = tmp_path / "test.log"
+        log_file.write_bytes(b"Output written on test.pdf (1 page).\n")
+        assert PDFCompiler()._needs_rerun(log_file) is False
+    
+    def test_no_rerun_without_log(self, tmp_path):
+        """No rerun if no log was written"""
+        assert PDFCompiler()._needs_rerun(tmp_path / "missing.log") is False
 
 
 class TestPDFCompilerCleanup:
@@ -126,3 +440,37 @@ class TestPDFCompilerCleanup:
         # Original tex should still exist
         assert tex_file.exists()
 
+    
+    def test_cleanup_artifacts_keeps_other_files(self, tmp_path):
+        """Cleanup only removes artifacts of the compiled document"""
+        compiler = PDFCompiler()
+        
+        tex_file = tmp_path / "test.tex"
+        tex_file.write_text("test")
+        (tmp_path / "test.synctex.gz").write_text("dummy")
+        (tmp_path / "test.pdf").write_text("dummy")
+        (tmp_path / "other.aux").write_text("dummy")
+        (tmp_path / "test2.log").write_text("dummy")
+        
+        compiler._cleanup_artifacts(tex_file)
+        
+        assert not (tmp_path / "test.synctex.gz").exists()
+        assert (tmp_path / "test.pdf").exists()
+        assert (tmp_path / "other.aux").exists()
+        assert (tmp_path / "test2.log").exists()
+
+
+class TestMoveFile:
+    """Tests for moving compiled files"""
+    
+    def test_move_replaces_existing_file(self, tmp_path):
+        """Moves the file and replaces an existing target"""
+        src = tmp_path / "document.pdf"
+        dst = tmp_path / "resume.pdf"
+        src.write_text("new")
+        dst.write_text("old")
+        
+        _move_file(src, dst)
+        
+        assert not src.exists()
+        assert dst.read_text() == "new"
@@ -5,7 +5,7 @@ Tests Jinja2 environment configuration and LaTeX filters.
 """
 
 import pytest
-from jinja2 import Environment
+from jinja2 import Environment, FileSystemBytecodeCache
 
 from awesomecv_jinja.config import create_latex_environment, latex_escape
 
@@ -63,6 +63,11 @@ class TestLatexEscape:
         """Doesn't modify plain text"""
         assert latex_escape("Hello World") == "Hello World"
     
+    def test_plain_text_returned_unchanged(self):
+        """Returns plain text as is, without copying"""
+        text = "Senior Software Engineer"
+        assert latex_escape(text) is text
+    
     def test_non_string_input(self):
         """Converts non-string to string"""
         assert latex_escape(123) == "123"
@@ -114,6 +119,23 @@ class TestCreateLatexEnvironment:
         assert env.trim_blocks is True
         assert env.lstrip_blocks is True
     
+    def test_bytecode_cache_disabled_by_default(self):
+        """No bytecode cache unless requested"""
+        env = create_latex_environment("awesome_cv")
+        assert env.bytecode_cache is None
+    
+    def test_uses_bytecode_cache(self, tmp_path):
+        """Uses the given bytecode cache"""
+        cache = FileSystemBytecodeCache(str(tmp_path))
+        env = create_latex_environment("awesome_cv", bytecode_cache=cache)
+        assert env.bytecode_cache is cache
+    
+    def test_auto_reload_configurable(self):
+        """Templates are checked for changes unless disabled"""
+        assert create_latex_environment("awesome_cv").auto_reload is True
+        env = create_latex_environment("awesome_cv", auto_reload=False)
+        assert env.auto_reload is False
+    
     def test_latex_escape_filter_registered(self):
         """latex_escape filter is registered"""
         env = create_latex_environment("awesome_cv")
@@ -4,6 +4,8 @@ Tests for renderer module.
 Tests Renderer class and render function.
 """
 
+import os
+import tempfile
 import pytest
 from pathlib import Path
 
@@ -38,44 +40,74 @@ class TestRendererInit:
         assert renderer.env is not None
         # Check custom delimiters
         assert renderer.env.variable_start_string == '((('
+    
+    def test_reuses_jinja_environment(self):
+        """Renderers for the same template share one environment"""
+        assert Renderer().env is Renderer(template="awesome_cv").env
+    
+    def test_custom_templates_reload_on_change(self, tmp_path):
+        """Only custom template directories are checked for edits"""
+        assert Renderer().env.auto_reload is False
+        assert Renderer(custom_template_dir=tmp_path).env.auto_reload is True
 
 
 class TestRendererListDocumentTypes:
     """Tests for list_document_types method"""
     
-    def test_lists_available_types(self):
+    def test_lists_available_types(self, renderer):
         """Lists available document types"""
-        renderer = Renderer()
         types = renderer.list_document_types()
         
         assert isinstance(types, list)
         assert len(types) > 0
     
-    def test_includes_resume(self):
+    def test_includes_resume(self, renderer):
         """Includes resume in available types"""
-        renderer = Renderer()
         types = renderer.list_document_types()
         assert "resume" in types
     
-    def test_includes_cv(self):
+    def test_includes_cv(self, renderer):
         """Includes cv in available types"""
-        renderer = Renderer()
         types = renderer.list_document_types()
         assert "cv" in types
     
-    def test_includes_coverletter(self):
+    def test_includes_coverletter(self, renderer):
         """Includes coverletter in available types"""
-        renderer = Renderer()
         types = renderer.list_document_types()
         assert "coverletter" in types
+    
+    def test_lists_custom_template_types(self, tmp_path):
+        """Discovers document types of custom templates, skipping includes"""
+        (tmp_path / "letter.tex.j2").write_text("letter")
+        (tmp_path / "poster.tex.j2").write_text("poster")
+        (tmp_path / "notes.txt").write_text("not a template")
+        (tmp_path / "sections").mkdir()
+        (tmp_path / "sections" / "header.tex.j2").write_text("header")
+        
+        renderer = Renderer(custom_template_dir=tmp_path)
+        assert renderer.list_document_types() == ["letter", "poster"]
+    
+    def test_returns_independent_lists(self, renderer):
+        """Modifying the returned list doesn't affect later calls"""
+        types = renderer.list_document_types()
+        types.clear()
+        assert "resume" in renderer.list_document_types()
+    
+    def test_custom_template_types_are_not_cached(self, tmp_path):
+        """Templates added to a custom directory are listed"""
+        (tmp_path / "letter.tex.j2").write_text("letter")
+        renderer = Renderer(custom_template_dir=tmp_path)
+        assert renderer.list_document_types() == ["letter"]
+        
+        (tmp_path / "poster.tex.j2").write_text("poster")
+        assert renderer.list_document_types() == ["letter", "poster"]
 
 
 class TestRendererGetTemplateInfo:
     """Tests for get_template_info method"""
     
-    def test_returns_template_info(self):
+    def test_returns_template_info(self, renderer):
         """Returns dictionary with template information"""
-        renderer = Renderer()
         info = renderer.get_template_info()
         
         assert isinstance(info, dict)
@@ -89,9 +121,8 @@ class TestRendererGetTemplateInfo:
         info = renderer.get_template_info()
         assert info['name'] == "awesome_cv"
     
-    def test_info_custom_false_for_builtin(self):
+    def test_info_custom_false_for_builtin(self, renderer):
         """custom flag is False for built-in templates"""
-        renderer = Renderer()
         info = renderer.get_template_info()
         assert info['custom'] is False
 
@@ -99,26 +130,23 @@ class TestRendererGetTemplateInfo:
 class TestRendererRender:
     """Tests for render method"""
     
-    def test_render_returns_string(self, resume_data):
+    def test_render_returns_string(self, renderer, resume_data):
         """render() returns a string"""
-        renderer = Renderer()
         result = renderer.render("resume", resume_data)
         
         assert isinstance(result, str)
         assert len(result) > 0
     
-    def test_render_contains_data(self, resume_data):
+    def test_render_contains_data(self, renderer, resume_data):
         """Rendered output contains input data"""
-        renderer = Renderer()
         result = renderer.render("resume", resume_data)
         
         # Should contain personal info
         assert resume_data["first_name"] in result
         assert resume_data["last_name"] in result
     
-    def test_render_produces_latex(self, resume_data):
+    def test_render_produces_latex(self, renderer, resume_data):
         """Rendered output is LaTeX document"""
-        renderer = Renderer()
         result = renderer.render("resume", resume_data)
         
         # Should have LaTeX structure
@@ -126,40 +154,37 @@ class TestRendererRender:
         assert r"\begin{document}" in result
         assert r"\end{document}" in result
     
-    def test_render_with_invalid_doc_type_raises_error(self, resume_data):
+    def test_render_with_invalid_doc_type_raises_error(self, renderer, resume_data):
         """Raises DocumentTypeNotFoundError for invalid document type"""
-        renderer = Renderer()
         with pytest.raises(DocumentTypeNotFoundError, match="not found"):
             renderer.render("invalid", resume_data)
     
-    def test_render_to_file(self, resume_data, tmp_render_dir):
+    def test_render_to_file(self, renderer, resume_data, tmp_render_dir):
         """Saves rendered output to file"""
-        renderer = Renderer()
         output_path = tmp_render_dir / "test.tex"
         
-        renderer.render("resume", resume_data, output=output_path)
+        result = renderer.render("resume", resume_data, output=output_path)
         
         assert output_path.exists()
         assert output_path.stat().st_size > 0
         
-        # Content should be same as non-file render
-        content = output_path.read_text()
-        expected = renderer.render("resume", resume_data)
-        assert content == expected
+        # Written content should be the returned string
+        assert output_path.read_text(encoding="utf-8") == result
     
-    def test_render_creates_output_directory(self, resume_data, tmp_render_dir):
+    def test_render_creates_output_directory(
+        self, renderer, resume_data, tmp_render_dir
+    ):
         """Creates output directory if it doesn't exist"""
-        renderer = Renderer()
         output_path = tmp_render_dir / "subdir" / "test.tex"
         
         renderer.render("resume", resume_data, output=output_path)
         
         assert output_path.exists()
     
-    def test_render_different_doc_types(self, resume_data, cv_data, coverletter_data):
+    def test_render_different_doc_types(
+        self, renderer, resume_data, cv_data, coverletter_data
+    ):
         """Can render different document types"""
-        renderer = Renderer()
-        
         resume = renderer.render("resume", resume_data)
         cv = renderer.render("cv", cv_data)
         letter = renderer.render("coverletter", coverletter_data)
@@ -174,6 +199,33 @@ class TestRendererRender:
             assert r"\documentclass" in output
 
 
+class TestRendererRenderToFile:
+    """Tests for render_to_file method"""
+    
+    def test_render_to_file_matches_render(
+        self, renderer, resume_data, tmp_render_dir
+    ):
+        """Writes the same content as render()"""
+        output_path = tmp_render_dir / "subdir" / "test.tex"
+        
+        result = renderer.render_to_file("resume", resume_data, output_path)
+        
+        assert result == output_path
+        content = output_path.read_text(encoding="utf-8")
+        assert content == renderer.render("resume", resume_data)
+    
+    def test_render_to_file_invalid_doc_type_raises_error(
+        self, renderer, resume_data, tmp_render_dir
+    ):
+        """Raises DocumentTypeNotFoundError and writes nothing"""
+        output_path = tmp_render_dir / "test.tex"
+        
+        with pytest.raises(DocumentTypeNotFoundError, match="not found"):
+            renderer.render_to_file("invalid", resume_data, output_path)
+        
+        assert not output_path.exists()
+
+
 class TestRenderFunction:
     """Tests for convenience render() function"""
     
@@ -206,3 +258,37 @@ class TestRenderFunction:
         result = render(resume_data, template="awesome_cv")
         assert isinstance(result, str)
 
+    
+    def test_render_function_reuses_renderer(self):
+        """Convenience functions share one Renderer per template"""
+        from awesomecv_jinja.renderer import _get_renderer
+        
+        assert _get_renderer("awesome_cv") is _get_renderer("awesome_cv")
+    
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX only")
+    def test_render_without_usable_bytecode_cache_dir(
+        self, resume_data, tmp_path, monkeypatch
+    ):
+        """Renders without the bytecode cache if its directory is unsafe"""
+        from awesomecv_jinja.renderer import _get_environment, _get_renderer
+        
+        # A file where Jinja expects its private cache directory
+        (tmp_path / f"_jinja2-cache-{os.getuid()}").write_text("")
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+        monkeypatch.setattr(tempfile, "tempdir", None)
+        _get_environment.cache_clear()
+        _get_renderer.cache_clear()
+        try:
+            result = render(resume_data)
+            assert Renderer().env.bytecode_cache is None
+        finally:
+            # Don't leave the cache-less environment to other tests
+            _get_environment.cache_clear()
+            _get_renderer.cache_clear()
+        
+        assert resume_data["first_name"] in result
+    
+    def test_render_function_with_invalid_template_raises_error(self, resume_data):
+        """Raises TemplateNotFoundError for invalid template"""
+        with pytest.raises(TemplateNotFoundError, match="not found"):
+            render(resume_data, template="nonexistent")